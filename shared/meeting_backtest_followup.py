@@ -18,14 +18,17 @@ Usage:
 import io
 import json
 import math
+import multiprocessing
 import os
 import re
 import sys
-from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from statistics import mean, median
-from typing import Optional
+from typing import NamedTuple, Optional
 
 # Shared utilities
 SKILLS_DIR = Path(__file__).parent.parent
@@ -62,7 +65,9 @@ try:
     HAS_NUMPY = True
 except ImportError:
     HAS_NUMPY = False
-    print("[WARN] numpy not available — some analyses will be skipped")
+    # Spawned analysis workers re-import this module; warn only once
+    if multiprocessing.parent_process() is None:
+        print("[WARN] numpy not available — some analyses will be skipped")
 
 try:
     from scipy import stats as sp_stats
@@ -70,6 +75,12 @@ try:
 except ImportError:
     HAS_SCIPY = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # ── Analysis 1: Data Pipeline Audit ───────────────────────────
 
@@ -763,33 +774,47 @@ class TransactionCostSensitivity:
             "win_rate": baseline_wr,
         }
 
-        for scenario in scenarios:
-            adj_excess = []
-            for p in bullish_acted:
-                cost_bps = TransactionCostSensitivity._get_cost_bps(
-                    p["ticker_yf"], scenario)
-                cost_pct = cost_bps / 10000  # convert bps to decimal
-                adj = p["excess_returns"][30] - cost_pct
-                adj_excess.append(adj)
-
-            adj_mean = mean(adj_excess) if adj_excess else None
-            adj_wr = (sum(1 for e in adj_excess if e > 0) / len(adj_excess)
-                      if adj_excess else None)
-
-            # Sharpe approximation
-            if adj_excess and len(adj_excess) > 1:
+        # Cost matrix [pick][scenario] in bps, computed once
+        cost_rows = [[TransactionCostSensitivity._get_cost_bps(p["ticker_yf"], scenario)
+                      for scenario in scenarios]
+                     for p in bullish_acted]
+
+        if HAS_NUMPY:
+            # Broadcast all scenarios at once: adj[i, s] = excess[i] - cost[i, s]
+            adj = (np.asarray(baseline_excess, dtype=np.float64)[:, None]
+                   - np.asarray(cost_rows, dtype=np.float64) / 10000)
+            means = adj.mean(axis=0)
+            win_rates = (adj > 0).mean(axis=0)
+            stds = adj.std(axis=0)
+            for j, scenario in enumerate(scenarios):
+                adj_mean = float(means[j])
+                std = float(stds[j])
+                results[scenario] = {
+                    "n": len(bullish_acted),
+                    "mean_excess": adj_mean,
+                    "win_rate": float(win_rates[j]),
+                    "sharpe": adj_mean / std if std > 0 else 0,
+                    "excess_reduction": baseline_mean - adj_mean,
+                }
+        else:
+            for j, scenario in enumerate(scenarios):
+                adj_excess = [e - row[j] / 10000  # convert bps to decimal
+                              for e, row in zip(baseline_excess, cost_rows)]
+
+                adj_mean = mean(adj_excess)
+                adj_wr = sum(1 for e in adj_excess if e > 0) / len(adj_excess)
+
+                # Sharpe approximation
                 std = (sum((e - adj_mean) ** 2 for e in adj_excess) / len(adj_excess)) ** 0.5
                 sharpe = adj_mean / std if std > 0 else 0
-            else:
-                sharpe = None
-
-            results[scenario] = {
-                "n": len(adj_excess),
-                "mean_excess": adj_mean,
-                "win_rate": adj_wr,
-                "sharpe": sharpe,
-                "excess_reduction": baseline_mean - adj_mean if adj_mean is not None else None,
-            }
+
+                results[scenario] = {
+                    "n": len(adj_excess),
+                    "mean_excess": adj_mean,
+                    "win_rate": adj_wr,
+                    "sharpe": sharpe,
+                    "excess_reduction": baseline_mean - adj_mean,
+                }
 
         # Binary search for breakeven cost
         if baseline_mean > 0:
@@ -809,9 +834,9 @@ class TransactionCostSensitivity:
 
         # Cost distribution under tiered scenario
         cost_dist = defaultdict(list)
-        for p in bullish_acted:
-            cost = TransactionCostSensitivity._get_cost_bps(p["ticker_yf"], "tiered")
-            cost_dist[cost].append(p["ticker_yf"])
+        tiered_idx = scenarios.index("tiered")
+        for p, row in zip(bullish_acted, cost_rows):
+            cost_dist[row[tiered_idx]].append(p["ticker_yf"])
         results["tiered_distribution"] = {
             f"{bps}bp": len(tickers) for bps, tickers in sorted(cost_dist.items())
         }
@@ -821,20 +846,58 @@ class TransactionCostSensitivity:
 
 # ── Analysis 6: Real P&L Replication ──────────────────────────
 
+class TradeRec(NamedTuple):
+    """One STK fill from trades.json (compact; replaces a per-trade dict)."""
+    date: date
+    direction: str
+    ticker: str
+    quantity: float
+    fill_price: Optional[float]  # exit_price = fill price in IBKR CSV
+    pnl_usd: float
+    commission: float
+    currency: str
+
+
 class RealPnLReplication:
     """Match backtest picks to actual trades in trades.json and compare P&L."""
 
     @staticmethod
     def replicate(picks: list[dict]) -> dict:
         """For each Bullish+Acted pick, find actual trades and compare returns."""
+        # Find Bullish+Acted picks
+        bullish_acted = [p for p in picks
+                         if p["sentiment"] == Sentiment.BULLISH and p["acted_on"]
+                         and p.get("returns", {}).get(30) is not None]
+
+        if not bullish_acted:
+            return {
+                "aggregate": {"n_matched": 0, "n_with_both_returns": 0, "n_unmatched": 0},
+                "matched": [],
+                "unmatched": [],
+            }
+
         # Load raw trades
         try:
-            with open(TRADES_PATH, encoding="utf-8") as f:
-                data = json.load(f)
+            if HAS_ORJSON:
+                data = orjson.loads(TRADES_PATH.read_bytes())
+            else:
+                with open(TRADES_PATH, encoding="utf-8") as f:
+                    data = json.load(f)
             raw_trades = data.get("trades", data) if isinstance(data, dict) else data
         except Exception as e:
             return {"error": f"Failed to load trades.json: {e}"}
 
+        if not raw_trades:
+            unmatched_picks = [{"ticker": p["ticker_yf"], "date": p["meeting_date"],
+                                "backtest_return_30": p["returns"][30]}
+                               for p in bullish_acted]
+            return {
+                "aggregate": {"n_matched": 0, "n_with_both_returns": 0,
+                              "n_unmatched": len(unmatched_picks)},
+                "matched": [],
+                "unmatched": unmatched_picks[:20],
+            }
+
         # Index trades by ticker (using trades.json ticker format)
         trades_by_ticker = defaultdict(list)
         for trade in raw_trades:
@@ -849,21 +912,22 @@ class RealPnLReplication:
                 continue
 
             d = datetime.strptime(trade_date, "%Y-%m-%d").date()
-            trades_by_ticker[ticker.upper()].append({
-                "date": d,
-                "direction": trade.get("direction", ""),
-                "ticker": ticker,
-                "quantity": trade.get("quantity", 0.0),
-                "fill_price": trade.get("exit_price"),  # exit_price = fill price in IBKR CSV
-                "pnl_usd": trade.get("pnl_usd", 0.0),
-                "commission": trade.get("commission", 0.0),
-                "currency": trade.get("currency", "USD"),
-            })
-
-        # Find Bullish+Acted picks
-        bullish_acted = [p for p in picks
-                         if p["sentiment"] == Sentiment.BULLISH and p["acted_on"]
-                         and p.get("returns", {}).get(30) is not None]
+            trades_by_ticker[ticker.upper()].append(TradeRec(
+                d,
+                trade.get("direction", ""),
+                ticker,
+                trade.get("quantity", 0.0),
+                trade.get("exit_price"),
+                trade.get("pnl_usd", 0.0),
+                trade.get("commission", 0.0),
+                trade.get("currency", "USD"),
+            ))
+
+        # Sort each ticker's trades once so pick windows become bisect slices
+        trade_dates = {}
+        for key, trades in trades_by_ticker.items():
+            trades.sort(key=lambda t: t.date)
+            trade_dates[key] = [t.date for t in trades]
 
         matched_results = []
         unmatched_picks = []
@@ -881,9 +945,13 @@ class RealPnLReplication:
             found_trades = []
 
             for candidate in candidates:
-                for trade in trades_by_ticker.get(candidate.upper(), []):
-                    if window_start <= trade["date"] <= window_end:
-                        found_trades.append(trade)
+                key = candidate.upper()
+                dates = trade_dates.get(key)
+                if not dates:
+                    continue
+                lo = bisect_left(dates, window_start)
+                hi = bisect_right(dates, window_end)
+                found_trades.extend(trades_by_ticker[key][lo:hi])
 
             if not found_trades:
                 unmatched_picks.append({
@@ -893,19 +961,29 @@ class RealPnLReplication:
                 })
                 continue
 
-            # Simplified FIFO matching
-            buys = sorted([t for t in found_trades if t["direction"] == "BUY"],
-                          key=lambda t: t["date"])
-            sells = sorted([t for t in found_trades if t["direction"] == "SELL"],
-                           key=lambda t: t["date"])
-
-            # Calculate actual entry/exit prices
-            total_buy_qty = sum(t["quantity"] for t in buys)
-            total_sell_qty = sum(t["quantity"] for t in sells)
-            total_buy_cost = sum(t["quantity"] * (t["fill_price"] or 0) for t in buys
-                                if t["fill_price"])
-            total_sell_proceeds = sum(t["quantity"] * (t["fill_price"] or 0) for t in sells
-                                      if t["fill_price"])
+            # Simplified FIFO matching: entry/exit prices, commission and
+            # first-buy / last-sell dates in a single pass
+            n_buys = n_sells = 0
+            first_buy_date = last_sell_date = None
+            total_buy_qty = total_sell_qty = 0.0
+            total_buy_cost = total_sell_proceeds = 0.0
+            total_commission = 0.0
+            for t in found_trades:
+                total_commission += abs(t.commission or 0)
+                if t.direction == "BUY":
+                    n_buys += 1
+                    if first_buy_date is None or t.date < first_buy_date:
+                        first_buy_date = t.date
+                    total_buy_qty += t.quantity
+                    if t.fill_price:
+                        total_buy_cost += t.quantity * t.fill_price
+                elif t.direction == "SELL":
+                    n_sells += 1
+                    if last_sell_date is None or t.date > last_sell_date:
+                        last_sell_date = t.date
+                    total_sell_qty += t.quantity
+                    if t.fill_price:
+                        total_sell_proceeds += t.quantity * t.fill_price
 
             avg_buy_price = total_buy_cost / total_buy_qty if total_buy_qty > 0 else None
             avg_sell_price = total_sell_proceeds / total_sell_qty if total_sell_qty > 0 else None
@@ -917,7 +995,6 @@ class RealPnLReplication:
                 actual_return = None
 
             # Commission impact
-            total_commission = sum(abs(t.get("commission", 0)) for t in found_trades)
             commission_bps = (total_commission / total_buy_cost * 10000
                               if total_buy_cost > 0 else 0)
 
@@ -941,12 +1018,12 @@ class RealPnLReplication:
                 "backtest_price": backtest_price,
                 "slippage": slippage,
                 "commission_bps": commission_bps,
-                "n_buys": len(buys),
-                "n_sells": len(sells),
+                "n_buys": n_buys,
+                "n_sells": n_sells,
                 "total_buy_qty": total_buy_qty,
                 "total_sell_qty": total_sell_qty,
-                "first_buy_date": buys[0]["date"] if buys else None,
-                "last_sell_date": sells[-1]["date"] if sells else None,
+                "first_buy_date": first_buy_date,
+                "last_sell_date": last_sell_date,
             })
 
         # Aggregate comparison
@@ -954,26 +1031,35 @@ class RealPnLReplication:
                      if r["actual_return"] is not None and r["backtest_return_30"] is not None]
 
         if with_both:
-            corr = None
-            if HAS_NUMPY and len(with_both) >= 5:
-                actual_arr = np.array([r["actual_return"] for r in with_both])
-                bt_arr = np.array([r["backtest_return_30"] for r in with_both])
-                corr_matrix = np.corrcoef(actual_arr, bt_arr)
-                corr = float(corr_matrix[0, 1])
-
             slippages = [r["slippage"] for r in matched_results if r["slippage"] is not None]
-            diffs = [r["diff"] for r in with_both]
+            mean_commission_bps = mean(r["commission_bps"] for r in matched_results)
+
+            corr = None
+            if HAS_NUMPY:
+                # Columns: backtest_return_30, actual_return, diff — assembled once
+                cols = np.array([(r["backtest_return_30"], r["actual_return"], r["diff"])
+                                 for r in with_both], dtype=np.float64)
+                mean_bt, mean_act, mean_diff = (float(m) for m in cols.mean(axis=0))
+                median_diff = float(np.median(cols[:, 2]))
+                if len(with_both) >= 5:
+                    corr = float(np.corrcoef(cols[:, 1], cols[:, 0])[0, 1])
+            else:
+                diffs = [r["diff"] for r in with_both]
+                mean_bt = mean(r["backtest_return_30"] for r in with_both)
+                mean_act = mean(r["actual_return"] for r in with_both)
+                mean_diff = mean(diffs)
+                median_diff = median(diffs)
 
             aggregate = {
                 "n_matched": len(matched_results),
                 "n_with_both_returns": len(with_both),
                 "n_unmatched": len(unmatched_picks),
-                "mean_backtest_return": mean(r["backtest_return_30"] for r in with_both),
-                "mean_actual_return": mean(r["actual_return"] for r in with_both),
-                "mean_diff": mean(diffs),
-                "median_diff": median(diffs),
+                "mean_backtest_return": mean_bt,
+                "mean_actual_return": mean_act,
+                "mean_diff": mean_diff,
+                "median_diff": median_diff,
                 "mean_slippage": mean(slippages) if slippages else None,
-                "mean_commission_bps": mean(r["commission_bps"] for r in matched_results),
+                "mean_commission_bps": mean_commission_bps,
                 "correlation": corr,
             }
         else:
@@ -993,6 +1079,14 @@ class RealPnLReplication:
 
 # ── Report Generator ──────────────────────────────────────────
 
+_SCORE_EMOJI = {"PASS": "PASS", "WEAK PASS": "WEAK", "FAIL": "FAIL"}
+
+
+def _fmt(value, spec: str, default: str = "N/A", suffix: str = "") -> str:
+    """Format a table cell, falling back to `default` when value is None."""
+    return default if value is None else format(value, spec) + suffix
+
+
 class FollowupReportGenerator:
     """Generate the Obsidian follow-up report."""
 
@@ -1065,14 +1159,16 @@ class FollowupReportGenerator:
         lines.append("| 场景 | N | 30天超额 | 30天胜率 | 90天超额 | Bootstrap分位 | Sharpe |")
         lines.append("| --- | ---: | ---: | ---: | ---: | ---: | ---: |")
 
-        for name, s in scenarios.items():
-            n = s.get("n_bullish_acted", 0)
-            e30 = f"{s['ba_excess_30d']:.2%}" if s.get("ba_excess_30d") is not None else "N/A"
-            wr30 = f"{s['ba_wr_30d']:.0%}" if s.get("ba_wr_30d") is not None else "N/A"
-            e90 = f"{s['ba_excess_90d']:.2%}" if s.get("ba_excess_90d") is not None else "N/A"
-            bp = f"{s['bootstrap_percentile']:.0f}%" if s.get("bootstrap_percentile") is not None else "N/A"
-            sh = f"{s['excess_sharpe']:.2f}" if s.get("excess_sharpe") is not None else "N/A"
-            lines.append(f"| {name} | {n} | {e30} | {wr30} | {e90} | {bp} | {sh} |")
+        rows = tuple(
+            (name, s.get("n_bullish_acted", 0),
+             _fmt(s.get("ba_excess_30d"), ".2%"),
+             _fmt(s.get("ba_wr_30d"), ".0%"),
+             _fmt(s.get("ba_excess_90d"), ".2%"),
+             _fmt(s.get("bootstrap_percentile"), ".0f", suffix="%"),
+             _fmt(s.get("excess_sharpe"), ".2f"))
+            for name, s in scenarios.items())
+        lines.extend(f"| {name} | {n} | {e30} | {wr30} | {e90} | {bp} | {sh} |"
+                     for name, n, e30, wr30, e90, bp, sh in rows)
 
         lines.append("")
 
@@ -1243,10 +1339,10 @@ class FollowupReportGenerator:
         for key in ["baseline", "fixed_10bp", "fixed_20bp", "fixed_30bp", "tiered"]:
             s = result.get(key, {})
             label = scenario_labels.get(key, key)
-            me = f"{s['mean_excess']:.2%}" if s.get("mean_excess") is not None else "N/A"
-            wr = f"{s['win_rate']:.0%}" if s.get("win_rate") is not None else "N/A"
-            sh = f"{s['sharpe']:.2f}" if s.get("sharpe") is not None else "—"
-            red = f"{s['excess_reduction']:.2%}" if s.get("excess_reduction") is not None else "—"
+            me = _fmt(s.get("mean_excess"), ".2%")
+            wr = _fmt(s.get("win_rate"), ".0%")
+            sh = _fmt(s.get("sharpe"), ".2f", "—")
+            red = _fmt(s.get("excess_reduction"), ".2%", "—")
             lines.append(f"| {label} | {me} | {wr} | {sh} | {red} |")
 
         lines.append("")
@@ -1535,13 +1631,12 @@ class FollowupReportGenerator:
         }
         for key, label in label_map.items():
             sc = scores.get(key, "N/A")
-            emoji = {"PASS": "PASS", "WEAK PASS": "WEAK", "FAIL": "FAIL"}.get(sc, "N/A")
+            emoji = _SCORE_EMOJI.get(sc, "N/A")
             lines.append(f"| {label} | {emoji} |")
         lines.append("")
 
-        pass_count = sum(1 for v in scores.values() if v == "PASS")
-        weak_count = sum(1 for v in scores.values() if v == "WEAK PASS")
-        fail_count = sum(1 for v in scores.values() if v == "FAIL")
+        cnt = Counter(scores.values())
+        pass_count, weak_count, fail_count = cnt["PASS"], cnt["WEAK PASS"], cnt["FAIL"]
         total = len(scores)
 
         if pass_count >= total * 0.6:
@@ -1597,9 +1692,25 @@ def run(use_cache: bool = True, verbose: bool = False):
     print("[4/4] Running 6 follow-up analyses...")
     print()
 
+    # The CPU-bound analyses only read all_picks — start them in worker
+    # processes up front and collect each result at its step below. The
+    # factor regression downloads from yfinance and prints progress, so it
+    # runs here in step 4 while the workers keep going.
+    analyses = {
+        "audit": DataPipelineAudit.audit,
+        "stress": ConcentrationStressTest.stress_test,
+        "block": ClusterRobustCI.block_bootstrap,
+        "nw": ClusterRobustCI.newey_west,
+        "cost": TransactionCostSensitivity.analyze,
+        "pnl": RealPnLReplication.replicate,
+    }
+    ex = ProcessPoolExecutor(max_workers=min(len(analyses), os.cpu_count() or 1))
+    futs = {name: ex.submit(fn, all_picks) for name, fn in analyses.items()}
+    ex.shutdown(wait=False)  # no more submissions; queued futures still run
+
     # ── Analysis 1: Data Pipeline Audit ───────────────────────
     print("  [1/6] Data Pipeline Audit...")
-    audit_result = DataPipelineAudit.audit(all_picks)
+    audit_result = futs["audit"].result()
     dc = audit_result.get("decay_curve", {})
     tm = audit_result.get("trade_mgmt_sim", {})
     print(f"    Decay curve N={dc.get('n', 0)}, "
@@ -1608,14 +1719,14 @@ def run(use_cache: bool = True, verbose: bool = False):
 
     # ── Analysis 2: Concentration Stress Test ─────────────────
     print("  [2/6] Concentration Stress Test...")
-    stress_result = ConcentrationStressTest.stress_test(all_picks)
+    stress_result = futs["stress"].result()
     n_scenarios = len(stress_result.get("scenarios", {}))
     print(f"    {n_scenarios} scenarios tested")
 
     # ── Analysis 3: Cluster-Robust CI ─────────────────────────
     print("  [3/6] Cluster-Robust Confidence Intervals...")
-    block_result = ClusterRobustCI.block_bootstrap(all_picks)
-    nw_result = ClusterRobustCI.newey_west(all_picks)
+    block_result = futs["block"].result()
+    nw_result = futs["nw"].result()
     if "error" not in block_result:
         ci = block_result.get("block_ci_95", (0, 0))
         print(f"    Block bootstrap 95% CI: [{ci[0]:.2%}, {ci[1]:.2%}]")
@@ -1639,7 +1750,7 @@ def run(use_cache: bool = True, verbose: bool = False):
 
     # ── Analysis 5: Transaction Cost Sensitivity ──────────────
     print("  [5/6] Transaction Cost Sensitivity...")
-    cost_result = TransactionCostSensitivity.analyze(all_picks)
+    cost_result = futs["cost"].result()
     if "error" not in cost_result:
         be = cost_result.get("breakeven_bps", 0)
         print(f"    Breakeven cost: {be:.0f} bps")
@@ -1648,7 +1759,7 @@ def run(use_cache: bool = True, verbose: bool = False):
 
     # ── Analysis 6: Real P&L Replication ──────────────────────
     print("  [6/6] Real P&L Replication...")
-    pnl_result = RealPnLReplication.replicate(all_picks)
+    pnl_result = futs["pnl"].result()
     if "error" not in pnl_result:
         agg = pnl_result.get("aggregate", {})
         print(f"    Matched: {agg.get('n_matched', 0)}, "
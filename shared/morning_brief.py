@@ -8,8 +8,11 @@ import sys
 import io
 import os
 import json
+import time
+import atexit
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 # Fix Windows console encoding
 if sys.platform == "win32":
@@ -22,6 +25,28 @@ PORTFOLIO_DIR = Path.home() / "PORTFOLIO"
 INBOX_DIR = VAULT_DIR / "收件箱"
 THESIS_DIR = PORTFOLIO_DIR / "research" / "companies"
 OUTPUT_DIR = VAULT_DIR / "收件箱"
+MARKET_CACHE_DIR = PORTFOLIO_DIR / "cache" / "morning_brief"
+MARKET_CACHE_TTL = 900  # seconds; intraday reruns reuse the snapshot
+
+# 13F filing deadlines: (month, day, quarter)
+_13F_DEADLINES = (
+    (2, 14, "Q4"),   # Feb 14
+    (5, 15, "Q1"),   # May 15
+    (8, 14, "Q2"),   # Aug 14
+    (11, 14, "Q3"),  # Nov 14
+)
+
+
+@lru_cache(maxsize=1)
+def _db():
+    """Persistent portfolio.db connection shared across the run (None if missing)."""
+    import sqlite3
+    db_path = PORTFOLIO_DIR / "portfolio_monitor" / "data" / "portfolio.db"
+    if not db_path.exists():
+        return None
+    conn = sqlite3.connect(str(db_path), isolation_level=None, check_same_thread=False)
+    atexit.register(conn.close)
+    return conn
 
 
 def _get_portfolio_tickers():
@@ -29,11 +54,10 @@ def _get_portfolio_tickers():
     tickers = []
     # Try reading from portfolio database
     try:
-        import sqlite3
-        db_path = PORTFOLIO_DIR / "portfolio_monitor" / "data" / "portfolio.db"
-        if db_path.exists():
-            conn = sqlite3.connect(str(db_path))
+        conn = _db()
+        if conn is not None:
             # Get tickers that have trades (simple heuristic for current holdings)
+            # Exclude options, futures, currency pairs, bonds and HK numeric codes
             cursor = conn.execute("""
                 SELECT DISTINCT ticker
                 FROM trades
@@ -43,24 +67,20 @@ def _get_portfolio_tickers():
                   AND ticker NOT LIKE 'ZN%'
                   AND ticker NOT LIKE 'SPX%'
                   AND ticker NOT LIKE 'NDX%'
+                  AND ticker NOT GLOB '*.*.*'
+                  AND ticker NOT GLOB '*.USD'
+                  AND ticker NOT GLOB '*.GBP'
+                  AND ticker NOT GLOB '*.HKD'
+                  AND ticker NOT GLOB '*USD.*'
+                  AND ticker NOT GLOB '*EUR.*'
+                  AND ticker NOT GLOB '*GBP.*'
+                  AND ticker NOT GLOB '*HKD.*'
+                  AND ticker NOT GLOB '*JPY.*'
+                  AND ticker NOT GLOB '[0-9][0-9][0-9][0-9]'
                 ORDER BY ticker
+                LIMIT 20
             """)
-            rows = cursor.fetchall()
-            conn.close()
-            # Filter to reasonable stock tickers (exclude options, futures, currencies)
-            for row in rows:
-                ticker = row[0]
-                # Skip currency pairs, bonds, and options
-                if '.' in ticker and ticker.count('.') > 1:
-                    continue
-                if ticker.endswith('.USD') or ticker.endswith('.GBP') or ticker.endswith('.HKD'):
-                    continue
-                if any(x in ticker for x in ['USD.', 'EUR.', 'GBP.', 'HKD.', 'JPY.']):
-                    continue
-                if ticker.isdigit() and len(ticker) == 4:
-                    # Hong Kong stocks
-                    continue
-                tickers.append(ticker)
+            tickers = [row[0] for row in cursor.fetchall()]
     except Exception:
         pass
 
@@ -73,39 +93,111 @@ def _get_portfolio_tickers():
     return tickers[:20]  # Limit to top 20 to avoid API overload
 
 
-def _get_market_data(tickers, quick=False):
-    """Get price changes for portfolio tickers."""
-    if quick:
-        return []
+@lru_cache(maxsize=1)
+def _get_portfolio_tickers_cached(day):
+    """Portfolio tickers memoized per calendar day (pass datetime.now().date())."""
+    return tuple(_get_portfolio_tickers())
 
-    results = []
+
+def _load_market_cache(date_str):
+    """Load today's market snapshot cache ({ticker: {fetched_at, row}})."""
+    cache_file = MARKET_CACHE_DIR / f"{date_str}.json"
+    if cache_file.exists():
+        try:
+            with open(cache_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError):
+            pass
+    return {}
+
+
+def _save_market_cache(date_str, cache):
+    """Persist today's market snapshot cache."""
+    try:
+        MARKET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(MARKET_CACHE_DIR / f"{date_str}.json", "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def _download_market_rows(tickers):
+    """Download price rows for tickers in one batched request. Returns {ticker: row}."""
     try:
         import yfinance as yf
-        for ticker in tickers[:15]:  # Limit to avoid API overload
-            try:
-                stock = yf.Ticker(ticker)
-                info = stock.info
-                price = info.get("currentPrice") or info.get("regularMarketPrice", 0)
-                prev_close = info.get("previousClose") or info.get("regularMarketPreviousClose", 0)
-                if price and prev_close:
-                    change_pct = ((price - prev_close) / prev_close) * 100
-                    week52_high = info.get("fiftyTwoWeekHigh", 0)
-                    week52_low = info.get("fiftyTwoWeekLow", 0)
-                    note = ""
-                    if week52_high and price > week52_high * 0.95:
-                        note = "接近 52 周新高"
-                    elif week52_low and price < week52_low * 1.05:
-                        note = "接近 52 周新低"
-                    results.append({
-                        "ticker": ticker,
-                        "price": price,
-                        "change_pct": change_pct,
-                        "note": note,
-                    })
-            except Exception:
-                continue
     except ImportError:
-        pass
+        return {}
+
+    # One batched request: last/prev close + 52-week range for every ticker
+    try:
+        data = yf.download(
+            " ".join(tickers),
+            period="1y",
+            interval="1d",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+            auto_adjust=False,
+        )
+    except Exception:
+        return {}
+
+    rows = {}
+    level0 = data.columns.get_level_values(0)
+    for ticker in tickers:
+        try:
+            # Single-ticker downloads may come back without the ticker level
+            df = data[ticker] if ticker in level0 else data
+            closes = df["Close"].dropna()
+            if len(closes) < 2:
+                continue
+            price = float(closes.iloc[-1])
+            prev_close = float(closes.iloc[-2])
+            if not (price and prev_close):
+                continue
+            change_pct = ((price - prev_close) / prev_close) * 100
+            week52_high = float(df["High"].max())
+            week52_low = float(df["Low"].min())
+            note = ""
+            if week52_high and price > week52_high * 0.95:
+                note = "接近 52 周新高"
+            elif week52_low and price < week52_low * 1.05:
+                note = "接近 52 周新低"
+            rows[ticker] = {
+                "ticker": ticker,
+                "price": price,
+                "change_pct": change_pct,
+                "note": note,
+            }
+        except Exception:
+            continue
+    return rows
+
+
+def _get_market_data(tickers, quick=False):
+    """Get price changes for portfolio tickers (cached on disk for MARKET_CACHE_TTL)."""
+    if quick:
+        return []
+
+    tickers = tickers[:15]  # Limit to avoid API overload
+    if not tickers:
+        return []
+
+    date_str = datetime.now().strftime("%Y-%m-%d")
+    now_ts = time.time()
+    cache = _load_market_cache(date_str)
+
+    stale = [t for t in tickers
+             if now_ts - cache.get(t, {}).get("fetched_at", 0) > MARKET_CACHE_TTL]
+    if stale:
+        fetched = _download_market_rows(stale)
+        if fetched:
+            for t in stale:
+                # Misses are cached too so a rerun doesn't re-request them
+                cache[t] = {"fetched_at": now_ts, "row": fetched.get(t)}
+            _save_market_cache(date_str, cache)
+
+    results = [cache[t]["row"] for t in tickers if t in cache and cache[t].get("row")]
     # Sort by absolute change
     results.sort(key=lambda x: abs(x["change_pct"]), reverse=True)
     return results
@@ -115,11 +207,12 @@ def _get_inbox_count():
     """Count new notes in inbox from last 24 hours."""
     if not INBOX_DIR.exists():
         return 0, []
-    cutoff = datetime.now() - timedelta(hours=24)
+    cutoff_ts = (datetime.now() - timedelta(hours=24)).timestamp()
     new_files = []
-    for f in INBOX_DIR.glob("*.md"):
-        if datetime.fromtimestamp(f.stat().st_mtime) > cutoff:
-            new_files.append(f.name)
+    with os.scandir(INBOX_DIR) as it:
+        for e in it:
+            if e.name.endswith(".md") and e.is_file() and e.stat().st_mtime > cutoff_ts:
+                new_files.append(e.name)
     return len(new_files), new_files[:5]
 
 
@@ -128,13 +221,16 @@ def _get_stale_theses(days=30):
     stale = []
     if not THESIS_DIR.exists():
         return stale
-    cutoff = datetime.now() - timedelta(days=days)
-    for d in THESIS_DIR.iterdir():
-        thesis_file = d / "thesis.md"
-        if thesis_file.exists():
-            mtime = datetime.fromtimestamp(thesis_file.stat().st_mtime)
-            if mtime < cutoff:
-                days_old = (datetime.now() - mtime).days
+    now_ts = datetime.now().timestamp()
+    cutoff_ts = now_ts - days * 86400
+    with os.scandir(THESIS_DIR) as it:
+        for d in it:
+            try:
+                mtime = os.stat(os.path.join(d.path, "thesis.md")).st_mtime
+            except OSError:
+                continue
+            if mtime < cutoff_ts:
+                days_old = int((now_ts - mtime) // 86400)
                 stale.append({"ticker": d.name.upper(), "days": days_old})
     stale.sort(key=lambda x: x["days"], reverse=True)
     return stale
@@ -218,18 +314,16 @@ def _get_yesterday_themes() -> dict:
 
 def _check_13f_deadline():
     """Check if within 7 days of a 13F deadline."""
-    deadlines = [
-        (2, 14, "Q4"),   # Feb 14
-        (5, 15, "Q1"),   # May 15
-        (8, 14, "Q2"),   # Aug 14
-        (11, 14, "Q3"),  # Nov 14
-    ]
-    today = datetime.now()
-    for month, day, quarter in deadlines:
-        deadline = datetime(today.year, month, day)
-        days_until = (deadline - today).days
-        if 0 <= days_until <= 7:
-            return f"距离 {quarter} 13F 截止日还有 {days_until} 天"
+    return _check_13f_deadline_cached(date.today().toordinal())
+
+
+@lru_cache(maxsize=1)
+def _check_13f_deadline_cached(today_ordinal):
+    today = date.fromordinal(today_ordinal)
+    for month, day, quarter in _13F_DEADLINES:
+        days = (date(today.year, month, day) - today).days
+        if 0 <= days <= 7:
+            return f"距离 {quarter} 13F 截止日还有 {days} 天"
     return None
 
 
@@ -519,69 +613,71 @@ def generate_trade_ideas():
 def generate_brief(quick=False):
     """Generate the full morning brief."""
     date_str = datetime.now().strftime("%Y-%m-%d")
-    lines = [f"# 📅 {date_str} 晨间简报\n"]
+    buf = io.StringIO()
+    buf.write(f"# 📅 {date_str} 晨间简报\n\n")
 
-    # 1. Portfolio tickers
-    tickers = _get_portfolio_tickers()
+    # 1. Portfolio tickers — every ticker-driven section needs yfinance, so
+    # --quick skips the lookup (and the yfinance/pandas import) entirely
+    tickers = [] if quick else list(_get_portfolio_tickers_cached(datetime.now().date()))
 
     # 1a. Overnight developments (pre/after-market movers >2%)
     if tickers and not quick:
         overnight_devs = _get_overnight_developments(tickers)
         if overnight_devs:
-            lines.append("## 🌙 隔夜动态\n")
+            buf.write("## 🌙 隔夜动态\n\n")
             for d in overnight_devs:
                 headline_str = f' — "{d["headline"]}"' if d["headline"] else ""
                 sign = "+" if d["change_pct"] > 0 else ""
-                lines.append(f"**{d['ticker']}**: {sign}{d['change_pct']:.1f}% ({d['session']}){headline_str}")
-            lines.append("")
+                buf.write(f"**{d['ticker']}**: {sign}{d['change_pct']:.1f}% ({d['session']}){headline_str}\n")
+            buf.write("\n")
 
     # 1b. Yesterday's earnings reaction
     if tickers and not quick:
         earnings_rows = _get_earnings_reaction(tickers)
         if earnings_rows:
-            lines.append("## 📊 昨日财报反应\n")
-            lines.append("| 公司 | EPS 预期 | EPS 实际 | 收入预期 | 收入实际 | 盘后反应 |")
-            lines.append("|------|---------|---------|---------|---------|---------|")
+            buf.write("## 📊 昨日财报反应\n\n")
+            buf.write("| 公司 | EPS 预期 | EPS 实际 | 收入预期 | 收入实际 | 盘后反应 |\n")
+            buf.write("|------|---------|---------|---------|---------|---------|\n")
             for r in earnings_rows:
-                lines.append(
-                    f"| {r['ticker']} | {r['eps_est']} | {r['eps_act']} | {r['rev_est']} | {r['rev_act']} | {r['reaction']} |"
+                buf.write(
+                    f"| {r['ticker']} | {r['eps_est']} | {r['eps_act']} | {r['rev_est']} | {r['rev_act']} | {r['reaction']} |\n"
                 )
-            lines.append("")
+            buf.write("\n")
 
     # 2. Market data
     if tickers:
-        lines.append("## 📊 持仓动态\n")
+        buf.write("## 📊 持仓动态\n\n")
         market = _get_market_data(tickers, quick=quick)
         if market:
-            lines.append("| Ticker | 价格 | 变动 | 备注 |")
-            lines.append("|--------|------|------|------|")
+            buf.write("| Ticker | 价格 | 变动 | 备注 |\n")
+            buf.write("|--------|------|------|------|\n")
             for m in market:
                 emoji = "🟢" if m["change_pct"] > 0 else "🔴" if m["change_pct"] < 0 else "⚪"
-                lines.append(f"| {m['ticker']} | ${m['price']:.2f} | {m['change_pct']:+.1f}% {emoji} | {m['note']} |")
-            lines.append("")
+                buf.write(f"| {m['ticker']} | ${m['price']:.2f} | {m['change_pct']:+.1f}% {emoji} | {m['note']} |\n")
+            buf.write("\n")
 
             # Flag big movers for news search
             big_movers = [m["ticker"] for m in market if abs(m["change_pct"]) > 3]
             if big_movers and not quick:
-                lines.append(f"**异动 ticker（>3%）：** {', '.join(big_movers)} — 建议 WebSearch 查新闻\n")
+                buf.write(f"**异动 ticker（>3%）：** {', '.join(big_movers)} — 建议 WebSearch 查新闻\n\n")
         else:
-            lines.append("*市场数据暂不可用*\n")
+            buf.write("*市场数据暂不可用*\n\n")
 
     # Overnight alerts (from price monitor)
     overnight = _get_overnight_alerts()
     if overnight:
-        lines.append("")
-        lines.append("## 异动监控回顾")
-        lines.append("")
-        lines.append("| Ticker | 变动 | 量比 | 原因 |")
-        lines.append("|--------|------|------|------|")
+        buf.write("\n")
+        buf.write("## 异动监控回顾\n")
+        buf.write("\n")
+        buf.write("| Ticker | 变动 | 量比 | 原因 |\n")
+        buf.write("|--------|------|------|------|\n")
         for a in overnight:
-            lines.append(
-                f"| {a['ticker']} | {a['change_pct']:+.1f}% | {a.get('volume_ratio', 'N/A')}x | {a.get('reason', 'N/A')[:40]} |"
+            buf.write(
+                f"| {a['ticker']} | {a['change_pct']:+.1f}% | {a.get('volume_ratio', 'N/A')}x | {a.get('reason', 'N/A')[:40]} |\n"
             )
 
     # 3. Tasks
-    lines.append("## ✅ 今日任务\n")
+    buf.write("## ✅ 今日任务\n\n")
     try:
         plan, oq = _get_tasks_summary()
         if plan and plan.get("tasks"):
@@ -591,13 +687,13 @@ def generate_brief(quick=False):
                 title = t.get("title", str(t))
                 ticker = t.get("ticker")
                 ticker_str = f" [{ticker}]" if ticker else ""
-                lines.append(f"{i}. [P{priority}] {title}{ticker_str}")
+                buf.write(f"{i}. [P{priority}] {title}{ticker_str}\n")
 
             # Add summary stats
             total_min = plan.get("total_minutes", 0)
             overdue = plan.get("overdue_count", 0)
             util = plan.get("utilization_pct", 0)
-            lines.append("")
+            buf.write("\n")
             stats = []
             if total_min:
                 stats.append(f"{total_min}分钟")
@@ -606,65 +702,65 @@ def generate_brief(quick=False):
             if util:
                 stats.append(f"容量{util}%")
             if stats:
-                lines.append(f"*{' | '.join(stats)}*")
+                buf.write(f"*{' | '.join(stats)}*\n")
         else:
-            lines.append("*无计划任务*")
-        lines.append("")
+            buf.write("*无计划任务*\n")
+        buf.write("\n")
 
         # Open questions summary
         if oq:
-            lines.append("## 📌 未解决研究问题\n")
-            lines.append("| Ticker | 问题数 | 高优先 | 最早 |")
-            lines.append("|--------|--------|--------|------|")
+            buf.write("## 📌 未解决研究问题\n\n")
+            buf.write("| Ticker | 问题数 | 高优先 | 最早 |\n")
+            buf.write("|--------|--------|--------|------|\n")
             for q in oq:
-                lines.append(f"| {q[0]} | {q[1]} | {q[2]} | {q[3][:10] if q[3] else '-'} |")
-            lines.append("")
+                buf.write(f"| {q[0]} | {q[1]} | {q[2]} | {q[3][:10] if q[3] else '-'} |\n")
+            buf.write("\n")
     except Exception as e:
         import traceback
         traceback.print_exc()
-        lines.append(f"*任务加载失败: {e}*\n")
+        buf.write(f"*任务加载失败: {e}*\n\n")
 
     # 4. Inbox
     inbox_count, inbox_files = _get_inbox_count()
     if inbox_count > 0:
-        lines.append("## 📥 收件箱\n")
-        lines.append(f"- {inbox_count} 篇新笔记待处理")
+        buf.write("## 📥 收件箱\n\n")
+        buf.write(f"- {inbox_count} 篇新笔记待处理\n")
         for f in inbox_files:
-            lines.append(f"  - {f}")
-        lines.append("")
+            buf.write(f"  - {f}\n")
+        buf.write("\n")
 
     # 5. Stale theses
     stale = _get_stale_theses()
     if stale:
-        lines.append("## ⚠️ 需要关注\n")
+        buf.write("## ⚠️ 需要关注\n\n")
         for s in stale[:5]:
-            lines.append(f"- **{s['ticker']}** thesis 已 {s['days']} 天未更新")
-        lines.append("")
+            buf.write(f"- **{s['ticker']}** thesis 已 {s['days']} 天未更新\n")
+        buf.write("\n")
 
     # 6. Yesterday's ingestion by theme (§ 📥 昨日入库)
     theme_data = _get_yesterday_themes()
     if theme_data["total"] > 0:
-        lines.append(f"## 📥 昨日入库 ({theme_data['total']} 条)\n")
+        buf.write(f"## 📥 昨日入库 ({theme_data['total']} 条)\n\n")
 
         if theme_data["by_theme"]:
-            lines.append("| Theme | Count | 代表性标题 |")
-            lines.append("|-------|-------|-----------|")
+            buf.write("| Theme | Count | 代表性标题 |\n")
+            buf.write("|-------|-------|-----------|\n")
             for theme, items in sorted(theme_data["by_theme"].items(), key=lambda x: -len(x[1])):
                 rep_title = items[0]["title"]
-                lines.append(f"| {theme} | {len(items)} | {rep_title} |")
+                buf.write(f"| {theme} | {len(items)} | {rep_title} |\n")
 
         if theme_data["unthemed"]:
-            lines.append(f"\n无主题: {len(theme_data['unthemed'])} 条")
+            buf.write(f"\n无主题: {len(theme_data['unthemed'])} 条\n")
             for item in theme_data["unthemed"][:3]:
-                lines.append(f"- [{item['type']}] {item['title']}")
+                buf.write(f"- [{item['type']}] {item['title']}\n")
 
-        lines.append("")
+        buf.write("\n")
     else:
         # Fallback to original KB count if no pipeline data
         kb_count = _get_kb_recent()
         if kb_count > 0:
-            lines.append(f"## 📚 知识库\n")
-            lines.append(f"- 昨日新增 {kb_count} 份研究资料\n")
+            buf.write(f"## 📚 知识库\n\n")
+            buf.write(f"- 昨日新增 {kb_count} 份研究资料\n\n")
 
     # 7. Consensus downgrade alerts
     if tickers and not quick:
@@ -672,23 +768,26 @@ def generate_brief(quick=False):
             from shared.consensus_data import scan_portfolio_downgrades, render_alerts_md
             alerts = scan_portfolio_downgrades(tickers[:10], track=True)
             if alerts:
-                lines.append(render_alerts_md(alerts))
+                buf.write(render_alerts_md(alerts))
+                buf.write("\n")
         except Exception:
             pass
 
     # 8. 13F deadline
     deadline_msg = _check_13f_deadline()
     if deadline_msg:
-        lines.append(f"## 📅 提醒\n")
-        lines.append(f"- {deadline_msg}\n")
+        buf.write(f"## 📅 提醒\n\n")
+        buf.write(f"- {deadline_msg}\n\n")
 
     # 9. Trade ideas (catalyst-driven, conviction changes, revisit triggers)
     if not quick:
         trade_ideas_block = generate_trade_ideas()
         if trade_ideas_block:
-            lines.append(trade_ideas_block)
+            buf.write(trade_ideas_block)
+            buf.write("\n")
 
-    return "\n".join(lines)
+    # Drop the final newline so the result matches the old "\n".join output
+    return buf.getvalue()[:-1]
 
 
 def main():
@@ -700,18 +799,18 @@ def main():
     date_str = datetime.now().strftime("%Y-%m-%d")
     output_file = OUTPUT_DIR / f"{date_str} - 晨间简报.md"
 
-    content = f"""---
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    # Stream frontmatter + brief so the report is never copied into a second string
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write(f"""---
 tags: [morning-brief, auto-generated]
 date: {date_str}
 type: morning-brief
 ---
 
-{brief}
-"""
-
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(content)
+""")
+        f.write(brief)
+        f.write("\n")
 
     try:
         print(brief)
@@ -13,36 +13,153 @@ Design:
     - Graceful degradation: returns empty results on NLM failure (never blocks)
 """
 
+import copy
+import functools
+import hashlib
+import io
 import json
+import os
 import re
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # ── Paths ──────────────────────────────────────────────────────
 NLM_SKILL_DIR = Path.home() / ".claude" / "skills" / "notebooklm"
 NLM_RUN_PY = NLM_SKILL_DIR / "scripts" / "run.py"
 NLM_LIBRARY_JSON = NLM_SKILL_DIR / "data" / "library.json"
-
-# Python executable
-PYTHON = r"C:\Users\thisi\AppData\Local\Python\pythoncore-3.14-64\python.exe"
-if not Path(PYTHON).exists():
-    # macOS / Linux fallback
-    PYTHON = sys.executable
+NLM_CACHE_DIR = NLM_SKILL_DIR / "cache"
+NLM_CACHE_TTL = 86400  # seconds; identical questions within a day reuse the answer
+
+# Python executable: the skill's own venv first (Windows, then POSIX layout),
+# then the pinned Windows interpreter, then whatever is running us.
+# Resolved once at import.
+PYTHON = str(next(
+    (p for p in (
+        NLM_SKILL_DIR / ".venv" / "Scripts" / "python.exe",
+        NLM_SKILL_DIR / ".venv" / "bin" / "python",
+        Path(r"C:\Users\thisi\AppData\Local\Python\pythoncore-3.14-64\python.exe"),
+    ) if p.exists()),
+    sys.executable,
+))
 
 # Default notebook for weekly meeting notes
 DEFAULT_NOTEBOOK_ID = "投资观点周报-2025"
 
+# Concurrent ask_question.py runs in query_multi_notebook. The NotebookLM skill
+# drives one browser profile (see ADD_WORKERS in notebooklm_sync.py), so
+# default to 1; raise with workers= / --workers only if it tolerates that.
+QUERY_WORKERS = 1
+
+# ── Compiled patterns ──────────────────────────────────────────
+_DATE_ISO = re.compile(r"(\d{4}-\d{2}-\d{2})")
+_DATE_LONG = re.compile(
+    r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})"
+)
+_MONTH_NUM = {
+    "January": "01", "February": "02", "March": "03", "April": "04",
+    "May": "05", "June": "06", "July": "07", "August": "08",
+    "September": "09", "October": "10", "November": "11", "December": "12",
+}
+# Numbered list items ("1. ..." / "2) ..."), one per line, found with a
+# single finditer over the whole answer; body is the stripped rest of the line
+_LIST_ITEM = re.compile(
+    r"(?m)^[^\S\n]*\d+[\.\)][^\S\n]+(?P<body>\S(?:[^\n]*\S)?)[^\S\n]*$"
+)
+# Line-start markers in ask_question.py output; m.lastgroup names the kind
+_NLM_MARKERS = re.compile(
+    r"(?m)^[^\S\n]*(?:"
+    r"(?P<sep>={20})"
+    r"|(?P<question>Question:[^\n]*\n?)"
+    r"|(?P<cites>--- Citations ---)[^\S\n]*$"
+    r"|(?P<stop>EXTREMELY IMPORTANT)"
+    r"|source:(?P<source_id>[^\n]*)"
+    r"|conversation_id:(?P<conv_id>[^\n]*)"
+    r")"
+    r"|^[^\S\n]+\[(?P<nums>[^\]\n]+)\][^\S\n]+(?P<text>[^\n]*)"
+)
+_SENTIMENT_WORDS = {
+    **dict.fromkeys(["bullish", "positive", "optimistic", "看多", "偏多"], "bullish"),
+    **dict.fromkeys(["bearish", "negative", "pessimistic", "看空", "偏空"], "bearish"),
+    **dict.fromkeys(["neutral", "mixed", "cautious", "中性"], "neutral"),
+}
+_SENTIMENT_RE = re.compile("|".join(_SENTIMENT_WORDS), re.IGNORECASE)
+_TICKER_BARE = re.compile(r"\b([A-Z]{2,5})\b")
+# Upper-case words that show up in NLM prose but are not tickers
+_SKIP_WORDS = frozenset({
+    # Function words
+    "THE", "AND", "FOR", "ARE", "NOT", "BUT", "ALL", "WAS", "HAS", "THIS",
+    "THAT", "WITH", "FROM", "INTO", "THEY", "WERE", "BEEN", "ALSO", "ONLY",
+    # Months and quarters
+    "JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "SEPT",
+    "OCT", "NOV", "DEC", "FY", "YTD", "YOY", "QOQ",
+    # Roles, places, currencies
+    "CEO", "CFO", "CTO", "COO", "USA", "US", "UK", "EU", "NYC", "HK",
+    "USD", "RMB", "CNY", "HKD", "EUR", "JPY",
+    # Finance and tech jargon
+    "API", "ETF", "IPO", "GDP", "CPI", "PMI", "FED", "FOMC", "SEC", "FDA",
+    "EPS", "PE", "ROE", "ROI", "GPU", "CPU", "LLM", "NOTE", "NA",
+})
+# Per-list-item metadata in one scan: ISO date | long date | $TICKER | sentiment
+_LINE_META = re.compile(
+    r"(?P<iso>\d{4}-\d{2}-\d{2})"
+    r"|(?P<long>(?P<mon>" + "|".join(_MONTH_NUM) + r")\s+(?P<day>\d{1,2}),?\s+(?P<year>\d{4}))"
+    r"|\$(?P<tkr>[A-Z]{1,5})\b"
+    r"|(?i:" + "|".join(_SENTIMENT_WORDS) + r")"
+)
+
 
 # ── Library helpers ────────────────────────────────────────────
 
+# (st_mtime_ns, library, topic_index, topic_text) — rebuilt only when
+# library.json changes. topic_index maps UPPER topic -> notebook ids;
+# topic_text holds each notebook's joined UPPER topics for substring matches.
+_LIB_CACHE: Optional[tuple[int, dict, dict[str, list[str]], dict[str, str]]] = None
+
+
+def _load_library_cached() -> tuple[dict, dict[str, list[str]], dict[str, str]]:
+    """Return (library, topic_index, topic_text), memoized on file mtime."""
+    global _LIB_CACHE
+    try:
+        mtime_ns = NLM_LIBRARY_JSON.stat().st_mtime_ns
+    except OSError:
+        return {"notebooks": {}, "active_notebook_id": None}, {}, {}
+    if _LIB_CACHE is not None and _LIB_CACHE[0] == mtime_ns:
+        return _LIB_CACHE[1:]
+    if HAS_ORJSON:
+        lib = orjson.loads(NLM_LIBRARY_JSON.read_bytes())
+    else:
+        with open(NLM_LIBRARY_JSON, encoding="utf-8") as f:
+            lib = json.load(f)
+    topic_index: dict[str, list[str]] = {}
+    topic_text: dict[str, str] = {}
+    for nb_id, nb in lib.get("notebooks", {}).items():
+        topics = [t.upper() for t in nb.get("topics", [])]
+        for t in dict.fromkeys(topics):
+            topic_index.setdefault(t, []).append(nb_id)
+        topic_text[nb_id] = " ".join(topics)
+    _LIB_CACHE = (mtime_ns, lib, topic_index, topic_text)
+    return lib, topic_index, topic_text
+
+
 def load_library() -> dict:
-    """Load the NotebookLM library.json."""
-    if not NLM_LIBRARY_JSON.exists():
-        return {"notebooks": {}, "active_notebook_id": None}
-    with open(NLM_LIBRARY_JSON, encoding="utf-8") as f:
-        return json.load(f)
+    """Load the NotebookLM library.json (memoized on file mtime).
+
+    The returned dict is shared between callers; treat it as read-only.
+    """
+    return _load_library_cached()[0]
 
 
 def get_notebook_ids() -> list[str]:
@@ -64,10 +181,14 @@ def _run_nlm_query(
     question: str,
     notebook_id: str = DEFAULT_NOTEBOOK_ID,
     conversation_id: Optional[str] = None,
-    timeout: int = 60,
+    timeout: float = 60,
+    deadline: Optional[float] = None,
 ) -> dict:
     """Run a NotebookLM query via subprocess and parse the output.
 
+    If deadline (a time.monotonic() value) is given, the subprocess timeout
+    is clamped to the time remaining, and no query is started once it passes.
+
     Returns:
         {
             "answer": str,          # Full answer text
@@ -98,28 +219,52 @@ def _run_nlm_query(
     if conversation_id:
         cmd.extend(["--conversation-id", conversation_id])
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            timeout=timeout,
-            cwd=str(NLM_SKILL_DIR),
-        )
-
-        # Decode with replacement to handle mixed encodings from Windows console
-        stdout = result.stdout.decode("utf-8", errors="replace") if result.stdout else ""
-        stderr = result.stderr.decode("utf-8", errors="replace") if result.stderr else ""
-
-        if result.returncode != 0:
+    if deadline is not None:
+        timeout = min(timeout, deadline - time.monotonic())
+        if timeout <= 0:
             return {
                 "answer": "",
                 "citations": [],
                 "conversation_id": None,
                 "success": False,
-                "error": stderr.strip() or f"Exit code {result.returncode}",
+                "error": "NLM query skipped: deadline exceeded",
             }
 
-        return _parse_nlm_output(stdout)
+    try:
+        # stdout is decoded incrementally by the pipe's text wrapper (no bytes
+        # copy of the whole answer is kept); stderr goes to a temp file so
+        # only one pipe needs draining.
+        with tempfile.TemporaryFile() as err_file:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=err_file,
+                bufsize=io.DEFAULT_BUFFER_SIZE,
+                # Decode with replacement to handle mixed encodings from Windows console
+                encoding="utf-8",
+                errors="replace",
+            )
+            try:
+                stdout, _ = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                # Per the subprocess docs: kill, then reap so pipes are drained
+                proc.kill()
+                proc.communicate()
+                raise
+
+            if proc.returncode != 0:
+                # stderr is only needed for the error message
+                err_file.seek(0)
+                stderr = err_file.read().decode("utf-8", errors="replace")
+                return {
+                    "answer": "",
+                    "citations": [],
+                    "conversation_id": None,
+                    "success": False,
+                    "error": stderr.strip() or f"Exit code {proc.returncode}",
+                }
+
+        return _parse_nlm_output(stdout or "")
 
     except subprocess.TimeoutExpired:
         return {
@@ -127,7 +272,7 @@ def _run_nlm_query(
             "citations": [],
             "conversation_id": None,
             "success": False,
-            "error": f"NLM query timed out after {timeout}s",
+            "error": f"NLM query timed out after {timeout:.0f}s",
         }
     except Exception as e:
         return {
@@ -139,71 +284,97 @@ def _run_nlm_query(
         }
 
 
+def _cached_nlm_query(
+    question: str,
+    notebook_id: str = DEFAULT_NOTEBOOK_ID,
+    timeout: float = 60,
+    ttl: int = NLM_CACHE_TTL,
+    deadline: Optional[float] = None,
+) -> dict:
+    """_run_nlm_query with a disk cache keyed on (question, notebook_id).
+
+    Only successful answers are cached; failures are always retried.
+    """
+    key = hashlib.sha256(f"{question}|{notebook_id}".encode("utf-8")).hexdigest()
+    cache_file = NLM_CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime < ttl:
+            with open(cache_file, encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    result = _run_nlm_query(
+        question, notebook_id=notebook_id, timeout=timeout, deadline=deadline
+    )
+    if result["success"]:
+        try:
+            NLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=NLM_CACHE_DIR, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            pass
+    return result
+
+
 def _parse_nlm_output(stdout: str) -> dict:
-    """Parse the stdout from ask_question.py into structured data."""
-    lines = stdout.split("\n")
+    """Parse the stdout from ask_question.py into structured data.
 
-    # Find answer section (between the two === separator lines)
-    sep_indices = [i for i, line in enumerate(lines) if line.strip().startswith("=" * 20)]
-    answer_text = ""
-    if len(sep_indices) >= 2:
-        # Answer is between first two separators, after the "Question:" line
-        answer_start = sep_indices[0] + 1
-        answer_end = sep_indices[1] if len(sep_indices) > 1 else len(lines)
-        answer_lines = []
-        skip_question = True
-        for line in lines[answer_start:answer_end]:
-            if skip_question and line.strip().startswith("Question:"):
-                skip_question = False
-                continue
-            if skip_question:
-                continue
-            # Stop at citations section
-            if line.strip() == "--- Citations ---":
-                break
-            answer_lines.append(line)
-        answer_text = "\n".join(answer_lines).strip()
-    elif len(sep_indices) == 2:
-        # Fallback: everything between separators
-        answer_text = "\n".join(lines[sep_indices[0]+1:sep_indices[1]]).strip()
-
-    # Parse citations
+    One _NLM_MARKERS scan over the raw text, no line list. The answer is
+    sliced out of stdout between the "Question:" line (after the first ====
+    separator) and "--- Citations ---" or the second separator. Citations run
+    from "--- Citations ---" until "EXTREMELY IMPORTANT".
+    """
+    sep_count = 0
+    ans_start = ans_end = None
     citations = []
     in_citations = False
+    citations_done = False
     current_citation = None
-    for line in lines:
-        if line.strip() == "--- Citations ---":
-            in_citations = True
-            continue
-        if not in_citations:
-            continue
-        if line.strip().startswith("EXTREMELY IMPORTANT"):
-            break
+    conv_id = None
 
-        # Citation line: [1,2] text...
-        cite_match = re.match(r"\s+\[([^\]]+)\]\s+(.*)", line)
-        if cite_match:
+    for m in _NLM_MARKERS.finditer(stdout):
+        kind = m.lastgroup
+        if kind == "sep":
+            if sep_count == 1 and ans_start is not None and ans_end is None:
+                ans_end = m.start()
+            sep_count += 1
+        elif kind == "question":
+            if sep_count == 1 and ans_start is None:
+                ans_start = m.end()
+        elif kind == "cites":
+            if sep_count == 1 and ans_start is not None and ans_end is None:
+                ans_end = m.start()
+            if not citations_done:
+                in_citations = True
+        elif kind == "conv_id":
+            if conv_id is None:
+                conv_id = m.group("conv_id").strip()
+        elif not in_citations or citations_done:
+            continue
+        elif kind == "stop":
+            citations_done = True
+        elif kind == "text":
+            # Citation line: [1,2] text...
             if current_citation:
                 citations.append(current_citation)
-            nums_str = cite_match.group(1)
-            nums = [int(n.strip()) for n in nums_str.split(",") if n.strip().isdigit()]
+            nums = [int(n.strip()) for n in m.group("nums").split(",") if n.strip().isdigit()]
             current_citation = {
                 "numbers": nums,
-                "text": cite_match.group(2).strip(),
+                "text": m.group("text").strip(),
                 "source_id": None,
             }
-        elif line.strip().startswith("source:") and current_citation:
-            current_citation["source_id"] = line.strip().replace("source:", "").strip()
+        elif kind == "source_id" and current_citation:
+            current_citation["source_id"] = m.group("source_id").strip()
 
     if current_citation:
         citations.append(current_citation)
 
-    # Parse conversation_id
-    conv_id = None
-    for line in lines:
-        if line.strip().startswith("conversation_id:"):
-            conv_id = line.strip().replace("conversation_id:", "").strip()
-            break
+    answer_text = ""
+    if sep_count >= 2 and ans_start is not None:
+        answer_text = stdout[ans_start:ans_end].strip()
 
     return {
         "answer": answer_text,
@@ -216,6 +387,39 @@ def _parse_nlm_output(stdout: str) -> dict:
 
 # ── Query templates ────────────────────────────────────────────
 
+# Successful per-ticker results, shared by every caller in this process
+# (thesis, review, flashback fan-out). LRU over (query, ticker, name, notebook).
+_QUERY_MEMO: OrderedDict[tuple, dict] = OrderedDict()
+_QUERY_MEMO_SIZE = 256
+_QUERY_MEMO_LOCK = threading.Lock()
+
+
+def _process_memo(func):
+    """Memoize a ticker query on (ticker, company_name, notebook_id).
+
+    Keyword-only extras such as deadline are not part of the key. Failures
+    are not stored, and callers always get their own deep copy since results
+    are mutated downstream (query_multi_notebook tags each mention).
+    """
+    @functools.wraps(func)
+    def wrapper(ticker, company_name="", notebook_id=DEFAULT_NOTEBOOK_ID, **kwargs):
+        key = (func.__name__, ticker, company_name, notebook_id)
+        with _QUERY_MEMO_LOCK:
+            hit = _QUERY_MEMO.get(key)
+            if hit is not None:
+                _QUERY_MEMO.move_to_end(key)
+                return copy.deepcopy(hit)
+        result = func(ticker, company_name, notebook_id, **kwargs)
+        if result["success"]:
+            with _QUERY_MEMO_LOCK:
+                _QUERY_MEMO[key] = copy.deepcopy(result)
+                if len(_QUERY_MEMO) > _QUERY_MEMO_SIZE:
+                    _QUERY_MEMO.popitem(last=False)
+        return result
+    return wrapper
+
+
+@_process_memo
 def query_first_mention(
     ticker: str,
     company_name: str = "",
@@ -244,7 +448,7 @@ def query_first_mention(
         f"Please include the exact date if available and quote the relevant passage."
     )
 
-    raw = _run_nlm_query(question, notebook_id=notebook_id)
+    raw = _cached_nlm_query(question, notebook_id=notebook_id)
 
     # Extract structured fields from the answer
     first_seen = _extract_date(raw["answer"])
@@ -269,13 +473,17 @@ def query_first_mention(
     }
 
 
+@_process_memo
 def query_perception_arc(
     ticker: str,
     company_name: str = "",
     notebook_id: str = DEFAULT_NOTEBOOK_ID,
+    deadline: Optional[float] = None,
 ) -> dict:
     """Query NLM for chronological discussion history of a ticker.
 
+    deadline: optional time.monotonic() cutoff, see _run_nlm_query.
+
     Returns:
         {
             "mentions": [                    # Chronological list
@@ -297,7 +505,7 @@ def query_perception_arc(
         f"Format as a numbered list."
     )
 
-    raw = _run_nlm_query(question, notebook_id=notebook_id)
+    raw = _cached_nlm_query(question, notebook_id=notebook_id, deadline=deadline)
 
     # Parse numbered list from answer
     mentions = _parse_mention_list(raw["answer"])
@@ -365,10 +573,15 @@ def query_multi_notebook(
     ticker: str,
     company_name: str = "",
     notebook_ids: Optional[list[str]] = None,
+    budget: Optional[float] = None,
+    workers: int = QUERY_WORKERS,
 ) -> dict:
     """Query multiple NLM notebooks for a ticker and merge results.
 
     Useful for /flashback — queries weekly reports + ticker-specific notebooks.
+    budget caps total wall time in seconds: notebooks still running when it
+    runs out come back with success=False and the rest are merged as usual.
+    workers caps how many notebooks are queried at once.
 
     Returns:
         {
@@ -379,21 +592,34 @@ def query_multi_notebook(
     """
     if notebook_ids is None:
         # Default: weekly report + any notebook whose topics mention the ticker
-        notebook_ids = [DEFAULT_NOTEBOOK_ID]
-        lib = load_library()
-        for nb_id, nb in lib.get("notebooks", {}).items():
-            if nb_id == DEFAULT_NOTEBOOK_ID:
-                continue
-            topics = [t.upper() for t in nb.get("topics", [])]
-            if ticker.upper() in topics or (company_name and company_name.upper() in " ".join(topics).upper()):
-                notebook_ids.append(nb_id)
+        lib, topic_index, topic_text = _load_library_cached()
+        matched = set(topic_index.get(ticker.upper(), ()))
+        if company_name:
+            name = company_name.upper()
+            matched.update(nb_id for nb_id, text in topic_text.items() if name in text)
+        matched.discard(DEFAULT_NOTEBOOK_ID)
+        # Keep library order for deterministic fan-out / merge
+        notebook_ids = [DEFAULT_NOTEBOOK_ID] + [
+            nb_id for nb_id in lib.get("notebooks", {}) if nb_id in matched
+        ]
 
     results = {}
     all_mentions = []
     any_success = False
-
-    for nb_id in notebook_ids:
-        arc = query_perception_arc(ticker, company_name, notebook_id=nb_id)
+    deadline = time.monotonic() + budget if budget is not None else None
+
+    # Each arc is a subprocess + network round-trip; with workers > 1 they are
+    # fanned out. Results are consumed in notebook order so the merge stays
+    # deterministic.
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(notebook_ids)))) as ex:
+        arcs = list(ex.map(
+            lambda nb_id: query_perception_arc(
+                ticker, company_name, notebook_id=nb_id, deadline=deadline
+            ),
+            notebook_ids,
+        ))
+
+    for nb_id, arc in zip(notebook_ids, arcs):
         results[nb_id] = arc
         if arc["success"]:
             any_success = True
@@ -401,8 +627,9 @@ def query_multi_notebook(
                 m["notebook"] = get_notebook_name(nb_id)
                 all_mentions.append(m)
 
-    # Sort combined mentions by date
-    all_mentions.sort(key=lambda m: m.get("date", "9999"))
+    # Sort combined mentions by date (undated last). list.sort evaluates the
+    # key once per element; `or` also maps the parser's date=None to the sentinel.
+    all_mentions.sort(key=lambda m: m.get("date") or "9999")
 
     return {
         "results": results,
@@ -413,70 +640,88 @@ def query_multi_notebook(
 
 # ── Parsing helpers ────────────────────────────────────────────
 
+def _long_date_iso(month: str, day: str, year: str) -> str:
+    return f"{year}-{_MONTH_NUM[month]}-{day.zfill(2)}"
+
+
 def _extract_date(text: str) -> Optional[str]:
     """Extract the first date-like pattern from text."""
     # Try YYYY-MM-DD
-    match = re.search(r"(\d{4}-\d{2}-\d{2})", text)
+    match = _DATE_ISO.search(text)
     if match:
         return match.group(1)
     # Try Month DD, YYYY
-    match = re.search(
-        r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})",
-        text,
-    )
+    match = _DATE_LONG.search(text)
     if match:
-        month_map = {
-            "January": "01", "February": "02", "March": "03", "April": "04",
-            "May": "05", "June": "06", "July": "07", "August": "08",
-            "September": "09", "October": "10", "November": "11", "December": "12",
-        }
-        m = month_map[match.group(1)]
-        d = match.group(2).zfill(2)
-        y = match.group(3)
-        return f"{y}-{m}-{d}"
+        return _long_date_iso(*match.groups())
     return None
 
 
-def _extract_sentiment(text: str) -> str:
-    """Extract sentiment from NLM answer text."""
-    text_lower = text.lower()
-    if any(w in text_lower for w in ["bullish", "positive", "optimistic", "看多", "偏多"]):
-        return "bullish"
-    if any(w in text_lower for w in ["bearish", "negative", "pessimistic", "看空", "偏空"]):
-        return "bearish"
-    if any(w in text_lower for w in ["neutral", "mixed", "cautious", "中性"]):
-        return "neutral"
+def _rank_sentiment(labels: set) -> str:
+    """Collapse the sentiment labels seen in a text: bullish > bearish > neutral."""
+    for label in ("bullish", "bearish", "neutral"):
+        if label in labels:
+            return label
     return "unknown"
 
 
+def _extract_sentiment(text: str) -> str:
+    """Extract sentiment from NLM answer text.
+
+    Any bullish keyword wins, then bearish, then neutral, regardless of where
+    each appears. One regex pass, stopping early on the first bullish hit.
+    """
+    found = set()
+    for m in _SENTIMENT_RE.finditer(text):
+        label = _SENTIMENT_WORDS[m.group(0).lower()]
+        if label == "bullish":
+            return label
+        found.add(label)
+    return _rank_sentiment(found)
+
+
+def _scan_line_meta(body: str) -> tuple[Optional[str], str, Optional[str]]:
+    """One _LINE_META pass over a list item: (date, sentiment, $ticker)."""
+    iso = long_date = dollar = None
+    recheck_iso = False
+    labels = set()
+    for m in _LINE_META.finditer(body):
+        kind = m.lastgroup
+        if kind == "iso":
+            if iso is None:
+                iso = m.group("iso")
+        elif kind == "long":
+            if long_date is None:
+                long_date = _long_date_iso(m.group("mon"), m.group("day"), m.group("year"))
+            if iso is None:
+                recheck_iso = True
+        elif kind == "tkr":
+            tkr = m.group("tkr")
+            if dollar is None:
+                dollar = tkr
+            # "$MIXED" hides the keyword from the sentiment branch
+            if tkr.lower() in _SENTIMENT_WORDS:
+                labels.add(_SENTIMENT_WORDS[tkr.lower()])
+        else:
+            labels.add(_SENTIMENT_WORDS[m.group(0).lower()])
+
+    if recheck_iso:
+        # A long date's year can swallow an ISO date ("May 5, 2024-01-02")
+        # ahead of the first ISO we saw; rescan on this rare path.
+        match = _DATE_ISO.search(body)
+        iso = match.group(1) if match else None
+    return iso or long_date, _rank_sentiment(labels), dollar
+
+
 def _parse_mention_list(text: str) -> list[dict]:
     """Parse a numbered list of mentions from NLM answer."""
     mentions = []
     # Match patterns like: 1. 2025-12-15 — bullish — "Some summary"
     # or: 1. On December 15, 2025, the sentiment was bullish: ...
-    lines = text.split("\n")
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        # Check if it's a numbered list item
-        if not re.match(r"^\d+[\.\)]\s", line):
-            continue
-
-        entry = {"date": None, "sentiment": "unknown", "summary": line}
-
-        # Extract date
-        date = _extract_date(line)
-        if date:
-            entry["date"] = date
-
-        # Extract sentiment
-        entry["sentiment"] = _extract_sentiment(line)
-
-        # Clean summary (remove number prefix)
-        entry["summary"] = re.sub(r"^\d+[\.\)]\s*", "", line).strip()
-
-        mentions.append(entry)
+    for item in _LIST_ITEM.finditer(text):
+        body = item.group("body")
+        date, sentiment, _ = _scan_line_meta(body)
+        mentions.append({"date": date, "sentiment": sentiment, "summary": body})
 
     return mentions
 
@@ -484,34 +729,18 @@ def _parse_mention_list(text: str) -> list[dict]:
 def _parse_candidate_list(text: str) -> list[dict]:
     """Parse a list of ticker candidates from NLM answer."""
     candidates = []
-    lines = text.split("\n")
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        if not re.match(r"^\d+[\.\)]\s", line):
-            continue
+    for item in _LIST_ITEM.finditer(text):
+        body = item.group("body")
+        date, _, ticker = _scan_line_meta(body)
 
-        entry = {"ticker": None, "context": line, "date": None}
+        # No $TICKER: fall back to the first standalone UPPER word
+        if ticker is None:
+            ticker_match = _TICKER_BARE.search(body)
+            if ticker_match and ticker_match.group(1) not in _SKIP_WORDS:
+                ticker = ticker_match.group(1)
 
-        # Try to extract a ticker symbol ($TICKER or standalone UPPER)
-        ticker_match = re.search(r"\$([A-Z]{1,5})\b", line)
-        if ticker_match:
-            entry["ticker"] = ticker_match.group(1)
-        else:
-            ticker_match = re.search(r"\b([A-Z]{2,5})\b", line)
-            if ticker_match:
-                # Quick filter for common non-ticker words
-                candidate = ticker_match.group(1)
-                skip_words = {"THE", "AND", "FOR", "ARE", "NOT", "BUT", "ALL", "WAS", "HAS"}
-                if candidate not in skip_words:
-                    entry["ticker"] = candidate
-
-        entry["date"] = _extract_date(line)
-        entry["context"] = re.sub(r"^\d+[\.\)]\s*", "", line).strip()
-
-        if entry["ticker"]:
-            candidates.append(entry)
+        if ticker:
+            candidates.append({"ticker": ticker, "context": body, "date": date})
 
     return candidates
 
@@ -547,6 +776,8 @@ def main():
     mn = sub.add_parser("multi-notebook", help="Query multiple notebooks")
     mn.add_argument("ticker", help="Ticker symbol")
     mn.add_argument("--name", default="", help="Company name")
+    mn.add_argument("--budget", type=float, default=None, help="Total time budget in seconds")
+    mn.add_argument("--workers", type=int, default=QUERY_WORKERS, help="Concurrent notebook queries")
 
     args = parser.parse_args()
 
@@ -583,7 +814,9 @@ def main():
             print(f"\nError: {result['error']}")
 
     elif args.command == "multi-notebook":
-        result = query_multi_notebook(args.ticker, args.name)
+        result = query_multi_notebook(
+            args.ticker, args.name, budget=args.budget, workers=args.workers
+        )
         print(f"\n=== Multi-Notebook: {args.ticker} ===")
         print(f"Queried {len(result['results'])} notebooks")
         for m in result["combined_mentions"]:
@@ -15,14 +15,28 @@ Usage:
 """
 
 import argparse
+import filecmp
+import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
+import threading
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 HOME = Path.home()
 SKILL_DIR = HOME / ".claude" / "skills"
@@ -50,34 +64,56 @@ MAX_TEXT_CHARS = 400_000
 # Max sources per notebook (NLM limit is 50)
 MAX_SOURCES = 50
 
-# Sleep between adds (rate limiting)
+# Minimum seconds between upload starts (rate limiting)
 ADD_SLEEP = 3
 
+# Concurrent uploads. The NotebookLM skill drives one browser profile, so
+# default to 1; raise with --workers only if the skill tolerates parallel adds.
+ADD_WORKERS = 1
+
+# Duplicate detection: files up to FINGERPRINT_FULL_MAX bytes are hashed whole,
+# larger ones by three FINGERPRINT_WINDOW samples (head, middle, tail)
+FINGERPRINT_FULL_MAX = 196 * 1024
+FINGERPRINT_WINDOW = 64 * 1024
+
 
 # --- State management ---
 
 
+def _loads(data: bytes):
+    # Both parsers take UTF-8 bytes directly, skipping a str decode
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
 def load_state() -> dict:
     if STATE_FILE.exists():
-        return json.loads(STATE_FILE.read_text(encoding="utf-8"))
+        return _loads(STATE_FILE.read_bytes())
     return {}
 
 
 def save_state(state: dict):
     STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    STATE_FILE.write_text(
-        json.dumps(state, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
+    if HAS_ORJSON:
+        STATE_FILE.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2))
+    else:
+        STATE_FILE.write_text(
+            json.dumps(state, ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
 
 
+@lru_cache(maxsize=1)
 def load_entity_dict() -> dict:
+    """Load entity_dictionary.yaml (parsed once per process; treat as read-only)."""
     dict_path = SKILL_DIR / "shared" / "entity_dictionary.yaml"
     if dict_path.exists():
         try:
             import yaml
 
-            return yaml.safe_load(dict_path.read_text(encoding="utf-8"))
+            # libyaml's C loader when PyYAML was built with it; same result
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            with open(dict_path, "rb") as f:
+                return yaml.load(f, Loader=loader)
         except Exception:
             pass
     return {}
@@ -86,11 +122,12 @@ def load_entity_dict() -> dict:
 def load_nlm_library() -> dict:
     lib_path = SKILL_DIR / "notebooklm" / "data" / "library.json"
     if lib_path.exists():
-        return json.loads(lib_path.read_text(encoding="utf-8"))
+        return _loads(lib_path.read_bytes())
     return {"notebooks": {}}
 
 
-def get_search_terms(ticker: str) -> list[str]:
+@lru_cache(maxsize=128)
+def get_search_terms(ticker: str) -> tuple[str, ...]:
     """Get search terms for a ticker (ticker + company name variations)."""
     terms = [ticker.upper()]
     ed = load_entity_dict()
@@ -102,36 +139,54 @@ def get_search_terms(ticker: str) -> list[str]:
             words = canonical.upper().split()
             if len(words) >= 2:
                 terms.append(words[0])
-    return terms
+    return tuple(terms)
 
 
-def matches_ticker(name: str, terms: list[str]) -> bool:
+@lru_cache(maxsize=128)
+def build_term_re(terms: tuple[str, ...]) -> re.Pattern:
+    """Compile search terms into one word-boundary alternation.
+
+    Memoized per term tuple and passed to matches_ticker, instead of
+    compiling one pattern per (name, term) pair. Terms are upper-case, so
+    IGNORECASE lets callers search names without an upper() copy.
+    """
+    alts = (t if t.isalnum() else re.escape(t) for t in terms)
+    return re.compile(r"\b(?:" + "|".join(alts) + r")\b", re.IGNORECASE)
+
+
+def matches_ticker(name: str, term_re: re.Pattern) -> bool:
     """Check if a name matches any search term using word boundaries.
 
-    Prevents 'PM' from matching 'JPM' or 'RPM'.
+    Prevents 'PM' from matching 'JPM' or 'RPM'. term_re comes from
+    build_term_re(get_search_terms(ticker)).
     """
-    name_upper = name.upper()
-    for term in terms:
-        pattern = r"\b" + re.escape(term) + r"\b"
-        if re.search(pattern, name_upper):
-            return True
-    return False
+    return term_re.search(name) is not None
 
 
 # --- File discovery ---
 
 
+def read_head(path: Path, chars: int) -> str:
+    """Return the first `chars` characters of a UTF-8 text file.
+
+    Reads at most 4 bytes per character instead of the whole file; newline
+    handling and undecodable bytes match read_text(errors="ignore").
+    """
+    with open(path, "rb") as f:
+        raw = f.read(chars * 4)
+    text = raw.decode("utf-8", errors="ignore")
+    return text.replace("\r\n", "\n").replace("\r", "\n")[:chars]
+
+
 def get_scan_paths(ticker: str, state_entry: dict) -> list[Path]:
     """Get all directories to scan for a ticker's content."""
     paths = []
-    search_terms = get_search_terms(ticker)
+    term_re = build_term_re(get_search_terms(ticker))
 
     # 1. Earnings Analysis (研究/财报分析) — find ticker-matching subfolders
     ea_dir = VAULT_DIR / "研究" / "财报分析"
     if ea_dir.exists():
-        for d in ea_dir.iterdir():
-            if d.is_dir() and matches_ticker(d.name, search_terms):
-                paths.append(d)
+        paths.extend(_matching_subdirs(ea_dir, term_re))
 
     # 2. Research Notes (研究/研究笔记) — will filter by filename later
     rn_dir = VAULT_DIR / "研究" / "研究笔记"
@@ -150,9 +205,7 @@ def get_scan_paths(ticker: str, state_entry: dict) -> list[Path]:
 
     # 6. Earnings Transcripts (PDFs)
     if TRANSCRIPTS_DIR.exists():
-        for d in TRANSCRIPTS_DIR.iterdir():
-            if d.is_dir() and matches_ticker(d.name, search_terms):
-                paths.append(d)
+        paths.extend(_matching_subdirs(TRANSCRIPTS_DIR, term_re))
 
     # 7. Custom scan paths from state
     for custom in state_entry.get("scan_paths", []):
@@ -163,82 +216,245 @@ def get_scan_paths(ticker: str, state_entry: dict) -> list[Path]:
     return list(set(paths))
 
 
-def is_ticker_owned_dir(scan_path: Path, search_terms: list[str]) -> bool:
+def _matching_subdirs(parent: Path, term_re: re.Pattern) -> list[Path]:
+    """Subdirectories of parent whose name matches the ticker's terms.
+
+    os.scandir's DirEntry answers is_dir() from the directory listing, so
+    only name matches (and symlinks) cost a stat.
+    """
+    with os.scandir(parent) as it:
+        return [
+            Path(e.path)
+            for e in it
+            if matches_ticker(e.name, term_re) and e.is_dir()
+        ]
+
+
+def is_ticker_owned_dir(scan_path: Path, term_re: re.Pattern) -> bool:
     """Check if a directory is specifically about this ticker (all files relevant)."""
     if not scan_path.is_dir():
         return False
-    name_upper = scan_path.name.upper()
     # Earnings Analysis/PM-US, Earnings Transcripts/Philip Morris (PM), etc.
-    return matches_ticker(scan_path.name, search_terms)
+    return matches_ticker(scan_path.name, term_re)
+
+
+class FoundFile(NamedTuple):
+    """A discovered file with the stat taken during the directory scan."""
 
+    path: Path
+    size: int
+    mtime_ns: int
 
-def discover_files(ticker: str, scan_paths: list[Path]) -> list[Path]:
-    """Discover files related to a ticker in scan paths."""
-    files = []
+
+def _iter_discover_files(ticker: str, scan_paths: list[Path]):
+    """Yield FoundFile entries related to a ticker as they are found.
+
+    Scan paths are visited in sorted order so the stream is stable between
+    runs. Overlapping scan paths can yield the same file twice. Sizes come
+    from DirEntry.stat(), which on Windows is served from the listing itself.
+    """
     search_terms = get_search_terms(ticker)
+    term_re = build_term_re(search_terms)
 
-    for scan_path in scan_paths:
+    for scan_path in sorted(scan_paths):
         if not scan_path.exists():
             continue
 
         # Single file (e.g., Supply Chain/PM_mentions.md)
         if scan_path.is_file():
             if scan_path.suffix.lower() in SYNC_EXTENSIONS:
-                files.append(scan_path)
+                st = scan_path.stat()
+                yield FoundFile(scan_path, st.st_size, st.st_mtime_ns)
             continue
 
         # Ticker-owned directory: all files are relevant
-        owned = is_ticker_owned_dir(scan_path, search_terms)
+        owned = is_ticker_owned_dir(scan_path, term_re)
+
+        with os.scandir(scan_path) as it:
+            for e in it:
+                if e.name.startswith("."):
+                    continue
+                suffix = os.path.splitext(e.name)[1].lower()
+                if suffix not in SYNC_EXTENSIONS or not e.is_file():
+                    continue
+                f = Path(e.path)
+
+                # Generic directory: match by filename or frontmatter
+                if not (owned or matches_ticker(e.name, term_re)):
+                    # Check frontmatter for .md files
+                    if suffix != ".md":
+                        continue
+                    try:
+                        head = read_head(f, 500)
+                    except Exception:
+                        continue
+                    if not any(t in head.upper() for t in search_terms):
+                        continue
 
-        for f in scan_path.iterdir():
-            if not f.is_file():
-                continue
-            if f.suffix.lower() not in SYNC_EXTENSIONS:
-                continue
-            if f.name.startswith("."):
-                continue
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                yield FoundFile(f, st.st_size, st.st_mtime_ns)
+
+
+def discover_files(ticker: str, scan_paths: list[Path]) -> list[FoundFile]:
+    """Discover files related to a ticker in scan paths (sorted by path, deduped)."""
+    # Scan paths can overlap; dedupe on the (cached) path string, not Path hashes
+    unique = {str(f.path): f for f in _iter_discover_files(ticker, scan_paths)}
+    return sorted(unique.values())
+
+
+def _iter_new_files(ticker: str, scan_paths: list[Path], synced: dict):
+    """Stream discovered files that are not yet synced, each path once."""
+    seen = set()
+    for f in _iter_discover_files(ticker, scan_paths):
+        key = str(f.path)
+        if key not in synced and key not in seen:
+            seen.add(key)
+            yield f
+
+
+# --- Duplicate detection ---
+
+
+def _fingerprint(path: Path, size: int) -> str:
+    """MD5 of the file, or of its head/middle/tail windows for large files."""
+    with open(path, "rb") as f:
+        if size <= FINGERPRINT_FULL_MAX:
+            return hashlib.md5(f.read()).hexdigest()
+        h = hashlib.md5()
+        for offset in (0, size // 2, size - FINGERPRINT_WINDOW):
+            f.seek(offset)
+            h.update(hashlib.md5(f.read(FINGERPRINT_WINDOW)).digest())
+        return h.hexdigest()
+
+
+def drop_duplicates(
+    files: list[FoundFile], entry: dict
+) -> tuple[list[FoundFile], list[tuple[FoundFile, str]]]:
+    """Split files into (unique, duplicates) by content, keeping the first copy.
+
+    The same transcript often sits in both PORTFOLIO and Earnings Transcripts;
+    uploading it twice wastes a source slot. Only files whose size collides
+    with another candidate or a synced source are fingerprinted, and
+    fingerprints are cached in entry["fingerprints"] as
+    path -> [size, mtime_ns, md5]. Sampled (large-file) matches are confirmed
+    byte-for-byte. Duplicates come back as (path, path of the kept copy).
+    """
+    cache = entry.get("fingerprints", {})
+    synced = entry.get("synced_sources", {})
 
-            if owned:
-                files.append(f)
+    present = {str(f.path) for f in files}
+    known = {
+        path: rec for path, rec in cache.items() if path in synced and path not in present
+    }
+    sizes = Counter(f.size for f in files)
+    sizes.update(rec[0] for rec in known.values())
+
+    # Previously synced copies win over anything found now
+    seen = {(rec[0], rec[2]): path for path, rec in known.items() if sizes[rec[0]] > 1}
+    fresh = dict(known)
+    unique, dupes = [], []
+    for f in files:
+        path, size, mtime_ns = f
+        if sizes[size] < 2:
+            unique.append(f)
+            continue
+        key = str(path)
+        rec = cache.get(key)
+        if not rec or rec[0] != size or rec[1] != mtime_ns:
+            try:
+                rec = [size, mtime_ns, _fingerprint(path, size)]
+            except OSError:
+                unique.append(f)
                 continue
+        fresh[key] = rec
 
-            # Generic directory: match by filename or frontmatter
-            if matches_ticker(f.name, search_terms):
-                files.append(f)
-                continue
+        other = seen.get((size, rec[2]))
+        if other is not None and (size <= FINGERPRINT_FULL_MAX or _same_bytes(path, other)):
+            dupes.append((f, other))
+        else:
+            seen.setdefault((size, rec[2]), key)
+            unique.append(f)
+
+    # Drop cache entries for files that are neither synced nor still present
+    entry["fingerprints"] = {
+        path: rec for path, rec in {**cache, **fresh}.items()
+        if path in synced or path in present
+    }
+    return unique, dupes
+
+
+def _remember_fingerprint(entry: dict, f: FoundFile):
+    """Cache a synced file's fingerprint so later copies are caught even if
+    no same-size candidate existed when it was uploaded."""
+    cache = entry.setdefault("fingerprints", {})
+    rec = cache.get(str(f.path))
+    if rec and rec[0] == f.size and rec[1] == f.mtime_ns:
+        return
+    try:
+        cache[str(f.path)] = [f.size, f.mtime_ns, _fingerprint(f.path, f.size)]
+    except OSError:
+        pass
 
-            # Check frontmatter for .md files
-            if f.suffix.lower() == ".md":
-                try:
-                    head = f.read_text(encoding="utf-8", errors="ignore")[:500]
-                    if any(t in head.upper() for t in search_terms):
-                        files.append(f)
-                except Exception:
-                    pass
 
-    return sorted(set(files))
+def _same_bytes(a: Path, b: str) -> bool:
+    try:
+        return filecmp.cmp(a, b, shallow=False)
+    except OSError:
+        return False
 
 
 # --- Source management ---
 
 
-def add_source(notebook_id: str, file_path: Path) -> bool:
-    """Add a single source to a NotebookLM notebook via source_manager.py."""
+class _StartLimiter:
+    """Space call starts at least `interval` seconds apart across threads."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def _add_source(
+    notebook_id: str,
+    file_path: Path,
+    limiter: _StartLimiter | None = None,
+    size: int | None = None,
+) -> tuple[str, str]:
+    """Add one source; returns (status, detail) with status OK / SKIP / ERROR.
+
+    Nothing is printed, so concurrent calls can report in completion order.
+    limiter, if given, is waited on just before the upload subprocess starts.
+    size (bytes, from discovery) lets clear-cut text files skip without a read.
+    """
     suffix = file_path.suffix.lower()
 
     # Check text file size
     if suffix in (".md", ".txt"):
+        # UTF-8 is 1-4 bytes per char, so these bounds hold without decoding
+        if size is not None and size < 100:
+            return "SKIP", f"(too small: {size} bytes)"
+        if size is not None and size > 4 * MAX_TEXT_CHARS:
+            return "SKIP", f"({size:,} bytes > {MAX_TEXT_CHARS:,} char limit)"
         try:
             content = file_path.read_text(encoding="utf-8", errors="ignore")
             if len(content) > MAX_TEXT_CHARS:
-                print(f"SKIP ({len(content):,} chars > {MAX_TEXT_CHARS:,} limit)")
-                return False
+                return "SKIP", f"({len(content):,} chars > {MAX_TEXT_CHARS:,} limit)"
             if len(content) < 100:
-                print(f"SKIP (too small: {len(content)} chars)")
-                return False
+                return "SKIP", f"(too small: {len(content)} chars)"
         except Exception as e:
-            print(f"ERROR reading: {e}")
-            return False
+            return "ERROR", f"reading: {e}"
 
     cmd = [
         PYTHON,
@@ -252,20 +468,31 @@ def add_source(notebook_id: str, file_path: Path) -> bool:
         "--wait",
     ]
 
+    if limiter is not None:
+        limiter.wait()
     try:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=180)
         if result.returncode == 0:
-            return True
-        else:
-            err = (result.stderr or result.stdout or "unknown error")[:200]
-            print(f"ERROR: {err}")
-            return False
+            return "OK", ""
+        return "ERROR", (result.stderr or result.stdout or "unknown error")[:200]
     except subprocess.TimeoutExpired:
-        print("TIMEOUT (180s)")
-        return False
+        return "ERROR", "TIMEOUT (180s)"
     except Exception as e:
-        print(f"ERROR: {e}")
-        return False
+        return "ERROR", str(e)
+
+
+def add_source(notebook_id: str, file_path: Path, size: int | None = None) -> bool:
+    """Add a single source to a NotebookLM notebook via source_manager.py."""
+    status, detail = _add_source(notebook_id, file_path, size=size)
+    if status != "OK":
+        print(_status_text(status, detail))
+    return status == "OK"
+
+
+def _status_text(status: str, detail: str) -> str:
+    if status == "ERROR":
+        return f"ERROR: {detail}"
+    return f"{status} {detail}".rstrip()
 
 
 # --- Commands ---
@@ -334,12 +561,19 @@ def cmd_scan(ticker: str):
         print(f"{ticker} not registered. Use: register {ticker} --notebook-id ID")
         return
 
+    synced = set(entry.get("synced_sources", {}).keys())
+    if len(synced) >= MAX_SOURCES:
+        # Nothing more can be added; skip the directory scan entirely
+        print(f"Scan: {ticker.upper()} → {entry['notebook_id']}")
+        print(f"At the {MAX_SOURCES}-source limit ({len(synced)} synced); nothing to scan.")
+        return
+
     scan_paths = get_scan_paths(ticker, entry)
     files = discover_files(ticker, scan_paths)
-    synced = set(entry.get("synced_sources", {}).keys())
 
-    new_files = [f for f in files if str(f) not in synced]
-    already = [f for f in files if str(f) in synced]
+    new_files, already = [], []
+    for f in files:
+        (already if str(f.path) in synced else new_files).append(f)
 
     print(f"Scan: {ticker.upper()} → {entry['notebook_id']}")
     print(f"Found {len(files)} files ({len(new_files)} new, {len(already)} synced)")
@@ -347,8 +581,8 @@ def cmd_scan(ticker: str):
     if new_files:
         print("\nNew files to sync:")
         for f in new_files:
-            size_kb = f.stat().st_size / 1024
-            print(f"  + {f.name} ({size_kb:.0f} KB)")
+            size_kb = f.size / 1024
+            print(f"  + {f.path.name} ({size_kb:.0f} KB)")
 
     if already:
         print(f"\nAlready synced: {len(already)} files")
@@ -358,7 +592,7 @@ def cmd_scan(ticker: str):
         print(f"\nWARNING: {over} files would exceed {MAX_SOURCES}-source limit")
 
 
-def cmd_sync(ticker: str, dry_run: bool = False):
+def cmd_sync(ticker: str, dry_run: bool = False, workers: int = ADD_WORKERS):
     """Sync new sources for a ticker."""
     state = load_state()
     entry = state.get(ticker.upper(), {})
@@ -368,21 +602,43 @@ def cmd_sync(ticker: str, dry_run: bool = False):
         return
 
     notebook_id = entry["notebook_id"]
-    scan_paths = get_scan_paths(ticker, entry)
-    files = discover_files(ticker, scan_paths)
     synced = entry.get("synced_sources", {})
+    if len(synced) >= MAX_SOURCES:
+        print(f"{ticker}: at the {MAX_SOURCES}-source limit ({len(synced)} synced), skipping.")
+        return
+
+    scan_paths = get_scan_paths(ticker, entry)
 
-    new_files = [f for f in files if str(f) not in synced]
+    # Pull candidates from the discovery stream only until one more unique
+    # file than the remaining slots is known, so a large vault isn't walked
+    # in full once the limit is certain. Duplicates are filtered before the
+    # limit so they don't use up slots (fingerprints are cached across passes).
+    current_count = len(synced)
+    limit = MAX_SOURCES - current_count
+    pending = _iter_new_files(ticker, scan_paths, synced)
+    candidates, new_files = [], []
+    while True:
+        want = limit + 1 - len(new_files)
+        batch = list(islice(pending, want))
+        candidates.extend(batch)
+        new_files, dupes = drop_duplicates(candidates, entry)
+        if len(new_files) > limit or len(batch) < want:
+            break
+    new_files.sort()
+    dupes.sort()
+
+    if dupes:
+        print(f"Skipping {len(dupes)} duplicate files:")
+        for f, kept in dupes:
+            print(f"  = {f.path.name} (same as {Path(kept).name})")
 
     if not new_files:
         print(f"{ticker}: No new files to sync.")
         return
 
     # Check source count limit
-    current_count = len(synced)
-    if current_count + len(new_files) > MAX_SOURCES:
-        limit = MAX_SOURCES - current_count
-        print(f"WARNING: {len(new_files)} new files would exceed {MAX_SOURCES} limit.")
+    if len(new_files) > limit:
+        print(f"WARNING: new files would exceed {MAX_SOURCES} limit.")
         print(f"Current: {current_count} synced. Limiting to {limit} new files.")
         new_files = new_files[:limit]
 
@@ -390,30 +646,34 @@ def cmd_sync(ticker: str, dry_run: bool = False):
 
     if dry_run:
         for f in new_files:
-            print(f"  [DRY RUN] Would add: {f.name}")
+            print(f"  [DRY RUN] Would add: {f.path.name}")
         return
 
     added = 0
     failed = 0
     skipped = 0
-    for i, f in enumerate(new_files, 1):
-        print(f"  [{i}/{len(new_files)}] {f.name}... ", end="", flush=True)
-        ok = add_source(notebook_id, f)
-        if ok:
-            print("OK")
-            synced[str(f)] = {
-                "added_at": datetime.now().isoformat(),
-                "file_type": f.suffix.lower(),
-            }
-            added += 1
-        elif "SKIP" in (getattr(sys.stdout, "_last_write", "") or ""):
-            skipped += 1
-        else:
-            failed += 1
-
-        # Rate limiting between adds
-        if i < len(new_files) and ok:
-            time.sleep(ADD_SLEEP)
+    limiter = _StartLimiter(ADD_SLEEP)
+    total = len(new_files)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+        futures = {
+            ex.submit(_add_source, notebook_id, f.path, limiter, f.size): f
+            for f in new_files
+        }
+        for i, fut in enumerate(as_completed(futures), 1):
+            f = futures[fut]
+            status, detail = fut.result()
+            print(f"  [{i}/{total}] {f.path.name}... {_status_text(status, detail)}")
+            if status == "OK":
+                synced[str(f.path)] = {
+                    "added_at": datetime.now().isoformat(),
+                    "file_type": f.path.suffix.lower(),
+                }
+                _remember_fingerprint(entry, f)
+                added += 1
+            elif status == "SKIP":
+                skipped += 1
+            else:
+                failed += 1
 
     # Update state
     entry["synced_sources"] = synced
@@ -425,7 +685,7 @@ def cmd_sync(ticker: str, dry_run: bool = False):
     print(f"Total synced for {ticker}: {len(synced)}")
 
 
-def cmd_sync_all(dry_run: bool = False):
+def cmd_sync_all(dry_run: bool = False, workers: int = ADD_WORKERS):
     """Sync all registered tickers."""
     state = load_state()
     if not state:
@@ -436,7 +696,7 @@ def cmd_sync_all(dry_run: bool = False):
         print(f"\n{'=' * 50}")
         print(f"  {ticker}")
         print(f"{'=' * 50}")
-        cmd_sync(ticker, dry_run=dry_run)
+        cmd_sync(ticker, dry_run=dry_run, workers=workers)
 
 
 def main():
@@ -460,10 +720,12 @@ def main():
     p_sync = sub.add_parser("sync", help="Sync new sources for a ticker")
     p_sync.add_argument("ticker", help="Ticker symbol")
     p_sync.add_argument("--dry-run", action="store_true", help="Preview only")
+    p_sync.add_argument("--workers", type=int, default=ADD_WORKERS, help="Concurrent uploads")
 
     # sync-all
     p_all = sub.add_parser("sync-all", help="Sync all registered tickers")
     p_all.add_argument("--dry-run", action="store_true", help="Preview only")
+    p_all.add_argument("--workers", type=int, default=ADD_WORKERS, help="Concurrent uploads")
 
     args = parser.parse_args()
 
@@ -474,9 +736,9 @@ def main():
     elif args.command == "scan":
         cmd_scan(args.ticker)
     elif args.command == "sync":
-        cmd_sync(args.ticker, dry_run=args.dry_run)
+        cmd_sync(args.ticker, dry_run=args.dry_run, workers=args.workers)
     elif args.command == "sync-all":
-        cmd_sync_all(dry_run=args.dry_run)
+        cmd_sync_all(dry_run=args.dry_run, workers=args.workers)
     else:
         parser.print_help()
 
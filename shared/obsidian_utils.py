@@ -1,7 +1,9 @@
 """Shared Obsidian vault utilities - replaces Obsidian MCP server.
 
 Provides tag management, frontmatter parsing, note moving (with wikilink
-updates), and vault search.  All functions operate directly on the filesystem.
+updates), and vault search.  All functions operate directly on the filesystem;
+vault-wide tag and link scans go through VaultIndex, an mtime-validated
+SQLite cache of each note's frontmatter and wikilinks.
 
 Usage::
 
@@ -9,17 +11,57 @@ Usage::
     from shared.obsidian_utils import add_tags, move_note, search_vault
 """
 
+import json
 import logging
+import os
 import re
+import sqlite3
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+from typing import NamedTuple
 
 logger = logging.getLogger(__name__)
 
 VAULT_DIR = Path.home() / "Documents" / "Obsidian Vault"
+VAULT_INDEX_DB = Path(__file__).parent / "data" / "vault_index.sqlite"
+
+# Thread count for vault-wide reads (I/O-bound; also caps open files)
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 # ── Frontmatter parsing ─────────────────────────────────────
 
-_FM_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
+def _split_frontmatter(content: str) -> tuple[str, int] | None:
+    """Locate the frontmatter block: (yaml_text, body_offset), or None.
+
+    Same result as matching ``^---\\s*\\n(.*?)\\n---\\s*\\n?`` (DOTALL), but the
+    closing fence is found with str.find rather than a lazy regex scan, and
+    notes without a leading "---" are rejected on the first bytes.
+    """
+    if not content.startswith("---"):
+        return None
+    n = len(content)
+    ws_end = 3
+    while ws_end < n and content[ws_end].isspace():
+        ws_end += 1
+    # The opening fence ends at the last newline of the whitespace after ---
+    nl = content.rfind("\n", 3, ws_end)
+    if nl < 0:
+        return None
+    start = nl + 1
+    close = content.find("\n---", start)
+    if close < 0:
+        # Only an empty block is left: "---\n\n---", closing on that newline
+        prev = content.rfind("\n", 3, nl)
+        if prev < 0 or nl != ws_end - 1 or not content.startswith("---", ws_end):
+            return None
+        start, close = prev + 1, nl
+    # Whitespace after the closing dashes belongs to the fence
+    body = close + 4
+    while body < n and content[body].isspace():
+        body += 1
+    return content[start:close], body
 
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
@@ -28,12 +70,12 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     Returns (frontmatter_dict, body) where body is everything after ---.
     If no frontmatter found, returns ({}, full_content).
     """
-    m = _FM_RE.match(content)
-    if not m:
+    split = _split_frontmatter(content)
+    if split is None:
         return {}, content
 
-    fm_text = m.group(1)
-    body = content[m.end() :]
+    fm_text, body_start = split
+    body = content[body_start:]
     fm: dict = {}
 
     for line in fm_text.split("\n"):
@@ -97,6 +139,146 @@ def update_frontmatter(content: str, updates: dict) -> str:
     return _serialize_frontmatter(fm) + "\n" + body
 
 
+# ── Vault index ──────────────────────────────────────────────
+
+_INDEX_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS notes ("
+    "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, "
+    "fm_json TEXT, links_json TEXT)"
+)
+
+
+class IndexedNote(NamedTuple):
+    path: str  # absolute path
+    frontmatter: dict | None  # None if the note is not valid UTF-8
+    links: list[str]  # wikilink targets (stripped), in file order
+
+
+class VaultIndex:
+    """Cached frontmatter and wikilink targets for every note in a vault.
+
+    refresh() is one scandir walk; a note is re-read only when its
+    (st_mtime_ns, st_size) differs from the row cached in VAULT_INDEX_DB,
+    so repeated vault-wide scans cost O(changed notes) reads. Notes are
+    returned in _walk_md order.
+    """
+
+    def __init__(self, vault_dir: Path = VAULT_DIR, db_path: Path = VAULT_INDEX_DB):
+        self.vault_dir = vault_dir
+        self.db_path = db_path
+        self._notes: list[IndexedNote] | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path))
+            conn.execute(_INDEX_SCHEMA)
+        except (OSError, sqlite3.Error):
+            # Unwritable location: index for this process only
+            conn = sqlite3.connect(":memory:")
+            conn.execute(_INDEX_SCHEMA)
+        return conn
+
+    def refresh(self) -> list[IndexedNote]:
+        """Walk the vault, re-parsing only notes that changed since last time."""
+        root = os.path.abspath(self.vault_dir)
+        conn = self._connect()
+        try:
+            cached = {
+                row[0]: row[1:]
+                for row in conn.execute(
+                    "SELECT path, mtime_ns, size, fm_json, links_json FROM notes "
+                    "WHERE path >= ? AND path < ?",
+                    (root + os.sep, root + chr(ord(os.sep) + 1)),
+                )
+            }
+            notes: list[IndexedNote | None] = []
+            stale = []  # (slot in notes, path, stat) to re-parse
+            for entry in _walk_md(root):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                row = cached.pop(entry.path, None)
+                if row is not None and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+                    fm = json.loads(row[2]) if row[2] is not None else None
+                    notes.append(IndexedNote(entry.path, fm, json.loads(row[3])))
+                else:
+                    stale.append((len(notes), entry.path, st))
+                    notes.append(None)
+
+            changed = []
+            parsed = _imap_threaded(_index_note, [path for _, path, _ in stale])
+            for (slot, path, st), result in zip(stale, parsed):
+                if result is None:  # unreadable; left out like before
+                    continue
+                fm, links = result
+                notes[slot] = IndexedNote(path, fm, links)
+                changed.append((
+                    path,
+                    st.st_mtime_ns,
+                    st.st_size,
+                    None if fm is None else json.dumps(fm, ensure_ascii=False),
+                    json.dumps(links, ensure_ascii=False),
+                ))
+
+            if changed:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO notes VALUES (?, ?, ?, ?, ?)", changed
+                )
+            if cached:  # rows for notes that no longer exist
+                conn.executemany("DELETE FROM notes WHERE path = ?", [(p,) for p in cached])
+            conn.commit()
+        finally:
+            conn.close()
+
+        self._notes = [n for n in notes if n is not None]
+        return self._notes
+
+    def notes(self) -> list[IndexedNote]:
+        """Notes as of the last refresh (refreshing on first use)."""
+        if self._notes is None:
+            self.refresh()
+        return self._notes
+
+    def files_with_tag(self, tag: str) -> list[str]:
+        """Absolute paths of notes whose frontmatter tags include tag."""
+        return [
+            n.path
+            for n in self.notes()
+            if n.frontmatter is not None and tag in n.frontmatter.get("tags", [])
+        ]
+
+    def incoming_links(self, filepath: str | Path) -> list[str]:
+        """Absolute paths of other notes with a wikilink resolving to filepath."""
+        path = _resolve(filepath, self.vault_dir)
+        stem = path.stem
+        note_rel = path.relative_to(self.vault_dir).with_suffix("").as_posix()
+        own = os.path.normcase(os.path.abspath(path))
+        return [
+            n.path
+            for n in self.notes()
+            if os.path.normcase(n.path) != own
+            and any(_link_matches(t, stem, note_rel) for t in n.links)
+        ]
+
+
+def _index_note(path: str) -> tuple[dict | None, list[str]] | None:
+    """Read one note for the index: (frontmatter, link targets).
+
+    Non-UTF-8 notes index as (None, []); None means the note is unreadable.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+    except UnicodeDecodeError:
+        return None, []
+    except PermissionError:
+        return None
+    fm, _ = parse_frontmatter(content)
+    return fm, [m.group(1).strip() for m in _WIKILINK_RE.finditer(content)]
+
+
 # ── Tag operations ───────────────────────────────────────────
 
 
@@ -115,7 +297,7 @@ def add_tags(
     existing.update(tags)
     fm["tags"] = sorted(existing)
 
-    path.write_text(_serialize_frontmatter(fm) + "\n" + body, encoding="utf-8")
+    _atomic_write(path, _serialize_frontmatter(fm) + "\n" + body)
     return fm["tags"]
 
 
@@ -131,42 +313,62 @@ def remove_tags(
     existing -= set(tags)
     fm["tags"] = sorted(existing)
 
-    path.write_text(_serialize_frontmatter(fm) + "\n" + body, encoding="utf-8")
+    _atomic_write(path, _serialize_frontmatter(fm) + "\n" + body)
     return fm["tags"]
 
 
 def rename_tag(old_tag: str, new_tag: str, vault_dir: Path = VAULT_DIR) -> list[str]:
     """Rename a tag across the entire vault. Returns list of modified file paths."""
-    modified = []
-    for md in vault_dir.rglob("*.md"):
-        try:
-            content = md.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, PermissionError):
-            continue
+    paths = VaultIndex(vault_dir).files_with_tag(old_tag)
+    renames = {old_tag: new_tag}
+    done = _imap_threaded(lambda p: _rename_tags_in_note(p, renames), paths)
+    return [os.path.relpath(p, vault_dir) for p, ok in zip(paths, done) if ok]
 
-        fm, body = parse_frontmatter(content)
-        tags = fm.get("tags", [])
-        if old_tag not in tags:
-            continue
 
-        tags = [new_tag if t == old_tag else t for t in tags]
-        fm["tags"] = sorted(set(tags))
-        md.write_text(_serialize_frontmatter(fm) + "\n" + body, encoding="utf-8")
-        modified.append(str(md.relative_to(vault_dir)))
+def rename_tags(renames: dict[str, str], vault_dir: Path = VAULT_DIR) -> list[str]:
+    """Apply several tag renames ({old: new}) in one pass over the vault.
 
-    return modified
+    Candidates come from the index's cached tags, so each affected note is
+    read and rewritten once however many of its tags change. Renames are
+    not chained. Returns list of modified file paths.
+    """
+    paths = [
+        n.path
+        for n in VaultIndex(vault_dir).notes()
+        if n.frontmatter is not None
+        and isinstance(tags := n.frontmatter.get("tags", []), list)
+        and not renames.keys().isdisjoint(tags)
+    ]
+    done = _imap_threaded(lambda p: _rename_tags_in_note(p, renames), paths)
+    return [os.path.relpath(p, vault_dir) for p, ok in zip(paths, done) if ok]
+
+
+def _rename_tags_in_note(path: str, renames: dict[str, str]) -> bool:
+    """Rewrite one note's tags; False if unreadable or no tag to rename."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+    except (UnicodeDecodeError, PermissionError):
+        return False
+
+    fm, body = parse_frontmatter(content)
+    tags = fm.get("tags", [])
+    if not isinstance(tags, list) or renames.keys().isdisjoint(tags):
+        return False
+
+    tags = [renames.get(t, t) for t in tags]
+    fm["tags"] = sorted(set(tags))
+    _atomic_write(path, _serialize_frontmatter(fm) + "\n" + body)
+    return True
 
 
 def list_tags(vault_dir: Path = VAULT_DIR) -> dict[str, int]:
     """List all tags in the vault with their usage counts."""
     counts: dict[str, int] = {}
-    for md in vault_dir.rglob("*.md"):
-        try:
-            content = md.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, PermissionError):
+    for note in VaultIndex(vault_dir).notes():
+        if note.frontmatter is None:
             continue
-        fm, _ = parse_frontmatter(content)
-        for tag in fm.get("tags", []):
+        for tag in note.frontmatter.get("tags", []):
             if isinstance(tag, str) and tag:
                 counts[tag] = counts.get(tag, 0) + 1
     return dict(sorted(counts.items(), key=lambda x: -x[1]))
@@ -186,11 +388,10 @@ def _find_notes_by_stem(
     Used to detect ambiguity: if len(result) > 1, the stem is ambiguous.
     """
     matches = []
-    for md in vault_dir.rglob("*.md"):
-        if md == exclude:
-            continue
-        if md.stem == stem:
-            matches.append(md)
+    skip = os.path.normcase(exclude) if exclude is not None else None
+    for entry in _walk_md(vault_dir):
+        if entry.name[:-3] == stem and os.path.normcase(entry.path) != skip:
+            matches.append(Path(entry.path))
     return matches
 
 
@@ -242,6 +443,10 @@ def move_note(
             old_stem,
         )
 
+    # Index before moving, so the source is still at its old path
+    notes = VaultIndex(vault_dir).refresh() if old_stem != new_stem else []
+    src_key = os.path.normcase(os.path.abspath(src))
+
     # Ensure destination directory exists
     dst.parent.mkdir(parents=True, exist_ok=True)
 
@@ -254,30 +459,34 @@ def move_note(
     ambiguous_skipped: list[str] = []
 
     if old_stem != new_stem:
-        for md in vault_dir.rglob("*.md"):
-            if md == dst:
+        for note in notes:
+            # The moved note itself, and notes with no link to it
+            if os.path.normcase(note.path) == src_key:
+                continue
+            if not any(_link_matches(t, old_stem, old_rel) for t in note.links):
                 continue
             try:
-                content = md.read_text(encoding="utf-8")
+                with open(note.path, encoding="utf-8") as f:
+                    content = f.read()
             except (UnicodeDecodeError, PermissionError):
                 continue
 
             skipped_in_file = []
-            new_content, count = _WIKILINK_RE.subn(
+            updated_in_file = []
+            new_content = _WIKILINK_RE.sub(
                 lambda m: _replace_link(
-                    m, old_stem, new_stem, old_rel, is_ambiguous, skipped_in_file
+                    m, old_stem, new_stem, old_rel, is_ambiguous,
+                    skipped_in_file, updated_in_file,
                 ),
                 content,
             )
             if skipped_in_file:
-                rel_md = str(md.relative_to(vault_dir))
+                rel_md = os.path.relpath(note.path, vault_dir)
                 ambiguous_skipped.extend(f"{rel_md}: [[{s}]]" for s in skipped_in_file)
-            if count > 0 and new_content != content:
-                md.write_text(new_content, encoding="utf-8")
-                actual = content.count(f"[[{old_stem}") - len(skipped_in_file)
-                if actual > 0:
-                    files_touched.append(str(md.relative_to(vault_dir)))
-                    links_updated += actual
+            if updated_in_file:
+                _atomic_write(note.path, new_content)
+                files_touched.append(os.path.relpath(note.path, vault_dir))
+                links_updated += len(updated_in_file)
 
     if ambiguous_skipped:
         logger.warning(
@@ -302,6 +511,7 @@ def _replace_link(
     old_rel: str,
     is_ambiguous: bool,
     skipped: list[str],
+    updated: list[str],
 ) -> str:
     """Replace wikilink target if it matches old_stem, with ambiguity awareness.
 
@@ -312,37 +522,39 @@ def _replace_link(
         old_rel: Vault-relative path without extension (e.g. "research/AAPL").
         is_ambiguous: True if other notes share the same stem.
         skipped: Mutable list; appended with skipped link targets for reporting.
+        updated: Mutable list; appended with each link target that was rewritten.
     """
     target = match.group(1).strip()
     alias = match.group(2) or ""
 
-    if "/" in target:
-        # Path-qualified link: [[folder/name]] → match against full relative path
-        # Normalize to posix for comparison
-        target_posix = target.replace("\\", "/")
-        if target_posix == old_rel:
-            if alias:
-                return f"[[{new_stem}{alias}]]"
-            return f"[[{new_stem}]]"
-        # Also check if the path suffix matches (Obsidian allows partial paths)
-        if old_rel.endswith("/" + target_posix):
-            if alias:
-                return f"[[{new_stem}{alias}]]"
-            return f"[[{new_stem}]]"
+    if not _link_matches(target, old_stem, old_rel):
         return match.group(0)
 
-    # Bare link: [[name]] → compare stem only
-    if target == old_stem:
-        if is_ambiguous:
-            # Ambiguous: skip this link to avoid incorrectly renaming
-            # links that may point to a different note with the same stem
-            skipped.append(target)
-            return match.group(0)
-        if alias:
-            return f"[[{new_stem}{alias}]]"
-        return f"[[{new_stem}]]"
+    if "/" not in target and is_ambiguous:
+        # Ambiguous bare link: skip to avoid incorrectly renaming
+        # links that may point to a different note with the same stem
+        skipped.append(target)
+        return match.group(0)
+
+    updated.append(target)
+    return f"[[{new_stem}{alias}]]"
+
+
+def _link_matches(target: str, stem: str, rel: str) -> bool:
+    """True if a (stripped) wikilink target resolves to the note at rel.
 
-    return match.group(0)
+    Args:
+        target: Link target, e.g. "AAPL" or "research/AAPL".
+        stem: Note filename without extension (e.g. "AAPL").
+        rel: Vault-relative path without extension (e.g. "research/AAPL").
+    """
+    if "/" in target:
+        # Path-qualified link: [[folder/name]] → match against full relative path,
+        # or a path suffix (Obsidian allows partial paths)
+        target_posix = target.replace("\\", "/")
+        return target_posix == rel or rel.endswith("/" + target_posix)
+    # Bare link: [[name]] → compare stem only
+    return target == stem
 
 
 # ── Search ───────────────────────────────────────────────────
@@ -368,41 +580,48 @@ def search_vault(
     results = []
     q = query.lower()
 
-    for md in vault_dir.rglob("*.md"):
+    if search_type in ("tag", "frontmatter"):
+        for note in VaultIndex(vault_dir).notes():
+            if len(results) >= max_results:
+                break
+            fm = note.frontmatter
+            if fm is None:
+                continue
+            rel = os.path.relpath(note.path, vault_dir)
+            if search_type == "tag":
+                tags = fm.get("tags", [])
+                if any(q in str(t).lower() for t in tags):
+                    results.append({"path": rel, "match": f"tags: {tags}", "line": None})
+            else:
+                for k, v in fm.items():
+                    if q in str(v).lower():
+                        results.append({"path": rel, "match": f"{k}: {v}", "line": None})
+                        break
+        return results
+
+    if search_type == "filename":
+        for entry in _walk_md(vault_dir):
+            if len(results) >= max_results:
+                break
+            stem = entry.name[:-3]
+            if q in stem.lower():
+                rel = os.path.relpath(entry.path, vault_dir)
+                results.append({"path": rel, "match": stem, "line": None})
+        return results
+
+    # Content search reads the notes themselves (only metadata is indexed)
+    paths = [entry.path for entry in _walk_md(vault_dir)]
+    for path, content in zip(paths, _imap_threaded(_read_note, paths)):
         if len(results) >= max_results:
             break
-
-        rel = str(md.relative_to(vault_dir))
-
-        if search_type == "filename":
-            if q in md.stem.lower():
-                results.append({"path": rel, "match": md.stem, "line": None})
+        if content is None:
             continue
 
-        try:
-            content = md.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, PermissionError):
-            continue
-
-        if search_type == "tag":
-            fm, _ = parse_frontmatter(content)
-            tags = fm.get("tags", [])
-            if any(q in str(t).lower() for t in tags):
-                results.append({"path": rel, "match": f"tags: {tags}", "line": None})
-
-        elif search_type == "frontmatter":
-            fm, _ = parse_frontmatter(content)
-            for k, v in fm.items():
-                if q in str(v).lower():
-                    results.append({"path": rel, "match": f"{k}: {v}", "line": None})
-                    break
-
-        else:  # content
-            for i, line in enumerate(content.split("\n"), 1):
-                if q in line.lower():
-                    snippet = line.strip()[:120]
-                    results.append({"path": rel, "match": snippet, "line": i})
-                    break  # one match per file
+        hit = _find_line(content, q)
+        if hit is not None:  # one match per file
+            line_no, line = hit
+            rel = os.path.relpath(path, vault_dir)
+            results.append({"path": rel, "match": line.strip()[:120], "line": line_no})
 
     return results
 
@@ -410,6 +629,95 @@ def search_vault(
 # ── Helpers ──────────────────────────────────────────────────
 
 
+def _imap_threaded(func, items, batch: int = IO_WORKERS * 4):
+    """Yield func(item) for each item, in order, from a thread pool.
+
+    Submits one batch at a time so a caller that stops early (search hitting
+    max_results) doesn't read the rest of the vault.
+    """
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as ex:
+        while chunk := list(islice(items, batch)):
+            yield from ex.map(func, chunk)
+
+
+def _atomic_write(path: str | Path, content: str) -> None:
+    """Replace a note's content without ever leaving it half-written.
+
+    Writes a temp file beside the note (keeping its permission bits) and
+    swaps it in with os.replace, so a crash leaves the old or new version.
+    """
+    path = os.fspath(path)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".md.tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        try:
+            os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+        except OSError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _find_line(content: str, q: str) -> tuple[int, str] | None:
+    """First line containing lower-case q (case-insensitive): (line_no, line).
+
+    One lower() and find() over the whole note instead of splitting it into
+    lines and lowering each one.
+    """
+    if "\n" in q:
+        return None
+    lower = content.lower()
+    idx = lower.find(q)
+    if idx < 0:
+        return None
+    line_idx = lower.count("\n", 0, idx)
+    if len(lower) != len(content):
+        # lower() changed some lengths (e.g. "İ"), so offsets don't carry over
+        return line_idx + 1, content.split("\n")[line_idx]
+    start = lower.rfind("\n", 0, idx) + 1
+    end = lower.find("\n", idx)
+    return line_idx + 1, content[start:end if end >= 0 else len(content)]
+
+
+def _read_note(path: str) -> str | None:
+    """Read a note as UTF-8; None if it can't be decoded or opened."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except (UnicodeDecodeError, PermissionError):
+        return None
+
+
+def _walk_md(root: Path):
+    """Yield a DirEntry for every .md file under root, like root.rglob("*.md").
+
+    Walks with os.scandir so file/dir checks use the cached dirent type
+    instead of a stat per path. Order matches rglob (pre-order, scandir
+    order); symlinked directories are not followed and unreadable ones
+    are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(".md"):
+                        yield entry
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
 def _resolve(filepath: str | Path, vault_dir: Path) -> Path:
     """Resolve a filepath relative to vault or absolute."""
     p = Path(filepath)
@@ -464,33 +772,10 @@ def delete_note(filepath: str | Path, vault_dir: Path = VAULT_DIR) -> dict:
     if not path.exists():
         raise FileNotFoundError(f"Note not found: {filepath}")
 
-    stem = path.stem
-    # Vault-relative path without extension for path-qualified link matching
-    note_rel = path.relative_to(vault_dir).with_suffix("").as_posix()
-    incoming = []
-
-    for md in vault_dir.rglob("*.md"):
-        if md == path:
-            continue
-        try:
-            text = md.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, PermissionError):
-            continue
-        # Quick pre-check: skip files that don't mention the stem at all
-        if f"[[{stem}" not in text and stem not in text:
-            continue
-        # Parse wikilinks properly to check for actual matches
-        for m in _WIKILINK_RE.finditer(text):
-            target = m.group(1).strip()
-            if "/" in target:
-                # Path-qualified link: check against full relative path
-                target_posix = target.replace("\\", "/")
-                if target_posix == note_rel or note_rel.endswith("/" + target_posix):
-                    incoming.append(str(md.relative_to(vault_dir)))
-                    break
-            elif target == stem:
-                incoming.append(str(md.relative_to(vault_dir)))
-                break
+    incoming = [
+        os.path.relpath(p, vault_dir)
+        for p in VaultIndex(vault_dir).incoming_links(path)
+    ]
 
     if incoming:
         return {"deleted": False, "incoming_links": incoming}
@@ -11,12 +11,22 @@ Usage:
 """
 
 import json
+import os
+import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from functools import wraps
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 sys.path.insert(0, r"C:\Users\thisi\.claude\skills")
 
 from shared.nlm_attribution import query_passed_candidates, DEFAULT_NOTEBOOK_ID
@@ -28,57 +38,153 @@ TRADES_JSON = PORTFOLIO_DIR / "portfolio_monitor" / "data" / "trades.json"
 VAULT_DIR = Path.home() / "Documents" / "Obsidian Vault"
 REVIEWS_DIR = VAULT_DIR / "Reviews"
 
+# passed.md frontmatter keys we read; value is cleaned like the old per-line
+# partition(":") parser (strip, then strip quotes)
+_PASSED_FM_RE = re.compile(
+    r"^\s*(first_seen|source|price_at_pass)[^\S\n]*:([^\n]*)$", re.MULTILINE
+)
 
-def get_current_portfolio_tickers() -> set[str]:
-    """Get tickers currently in portfolio from trades.json or portfolio API."""
-    tickers = set()
 
-    # From trades.json — tickers with net long position
+def _mtime_cached(*watched: str):
+    """Cache a no-argument function until a watched path's mtime changes.
+
+    watched names module-level Path globals (looked up on each call, so
+    reassigning them also invalidates). Only the named paths themselves are
+    stat'ed: an edit inside an existing company dir doesn't bump
+    RESEARCH_DIR's mtime, which is fine for these manually run commands.
+    Callers must treat cached results as read-only.
+    """
+    def decorator(func):
+        cache = {}
+
+        @wraps(func)
+        def wrapper():
+            key = []
+            for name in watched:
+                path = globals()[name]
+                try:
+                    key.append((str(path), os.stat(path).st_mtime_ns))
+                except OSError:
+                    key.append((str(path), None))
+            key = tuple(key)
+            if cache.get("key") != key:
+                cache["value"] = func()
+                cache["key"] = key
+            return cache["value"]
+
+        return wrapper
+
+    return decorator
+
+
+def _company_dirs() -> list[os.DirEntry]:
+    """Directories under RESEARCH_DIR, in the order sorted(iterdir()) gives.
+
+    os.scandir answers is_dir() from the directory listing instead of a stat
+    per entry; sorting on normcase(name) matches Path ordering per platform.
+    """
+    try:
+        with os.scandir(RESEARCH_DIR) as it:
+            dirs = [e for e in it if e.is_dir()]
+    except FileNotFoundError:
+        return []
+    dirs.sort(key=lambda e: os.path.normcase(e.name))
+    return dirs
+
+
+_PASSED_SECTIONS = ("## Why I Passed", "## Revisit Trigger")
+
+
+def _passed_head_complete(content: str) -> bool:
+    """True once a passed.md prefix holds everything scan_passed_records reads.
+
+    That is the closing frontmatter fence and both sections up to the "## "
+    heading that ends them; the growing Passed Log / Price Check tail after
+    Revisit Trigger is never needed.
+    """
+    if content.startswith("---"):
+        if content.find("---", 3) < 0:
+            return False
+    elif "---".startswith(content):
+        return False
+    for marker in _PASSED_SECTIONS:
+        i = content.find(marker)
+        if i < 0:
+            return False
+        after = i + len(marker)
+        # A "\n## " right after the marker means "use the rest of the file"
+        if content.find("\n## ", after) <= after:
+            return False
+    return True
+
+
+def _read_passed_md(path: str, chunk: int = 4096) -> str:
+    """Read passed.md in chunks, stopping as soon as the needed part is in."""
+    parts = []
+    with open(path, encoding="utf-8") as f:
+        while block := f.read(chunk):
+            parts.append(block)
+            content = "".join(parts)
+            if _passed_head_complete(content):
+                return content
+            parts = [content]
+    return "".join(parts)
+
+
+@_mtime_cached("RESEARCH_DIR")
+def _scan_research_dir() -> tuple[frozenset[str], frozenset[str]]:
+    """(tickers with thesis.yaml, tickers with passed.md) from one directory walk.
+
+    Both ticker getters share this, so RESEARCH_DIR is listed once per run.
+    """
+    theses, passed = set(), set()
+    for d in _company_dirs():
+        ticker = d.name.upper()
+        if os.path.exists(os.path.join(d.path, "thesis.yaml")):
+            theses.add(ticker)
+        if os.path.exists(os.path.join(d.path, "passed.md")):
+            passed.add(ticker)
+    return frozenset(theses), frozenset(passed)
+
+
+@_mtime_cached("TRADES_JSON")
+def _trade_tickers() -> frozenset[str]:
+    """Tickers that appear in trades.json."""
+    tickers = set()
     if TRADES_JSON.exists():
         try:
-            with open(TRADES_JSON, encoding="utf-8") as f:
-                data = json.load(f)
+            raw = TRADES_JSON.read_bytes()
+            data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
             trades = data if isinstance(data, list) else data.get("trades", [])
-            for t in trades:
-                ticker = (t.get("ticker") or t.get("symbol") or "").upper()
-                if ticker:
-                    tickers.add(ticker)
+            tickers = {(t.get("ticker") or t.get("symbol") or "").upper() for t in trades}
+            tickers.discard("")
         except Exception:
-            pass
+            tickers = set()
+    return frozenset(tickers)
 
-    # From research directories with thesis.yaml (active theses)
-    if RESEARCH_DIR.exists():
-        for d in RESEARCH_DIR.iterdir():
-            if d.is_dir() and (d / "thesis.yaml").exists():
-                tickers.add(d.name.upper())
 
-    return tickers
+def get_current_portfolio_tickers() -> set[str]:
+    """Get tickers currently in portfolio from trades.json or portfolio API."""
+    # From trades.json — tickers with net long position, plus research
+    # directories with thesis.yaml (active theses)
+    return set(_trade_tickers() | _scan_research_dir()[0])
 
 
 def get_existing_passed_tickers() -> set[str]:
     """Get tickers with existing passed.md records."""
-    passed = set()
-    if RESEARCH_DIR.exists():
-        for d in RESEARCH_DIR.iterdir():
-            if d.is_dir() and (d / "passed.md").exists():
-                passed.add(d.name.upper())
-    return passed
+    return set(_scan_research_dir()[1])
 
 
+@_mtime_cached("RESEARCH_DIR")
 def scan_passed_records() -> list[dict]:
-    """Scan all passed.md files and extract data.
+    """Scan all passed.md files and extract data (cached; treat as read-only).
 
     Returns list of dicts with: ticker, passed_date, source, reason, price_at_pass, revisit_trigger.
     """
     records = []
-    if not RESEARCH_DIR.exists():
-        return records
-
-    for d in sorted(RESEARCH_DIR.iterdir()):
-        if not d.is_dir():
-            continue
-        passed_md = d / "passed.md"
-        if not passed_md.exists():
+    for d in _company_dirs():
+        passed_md = os.path.join(d.path, "passed.md")
+        if not os.path.exists(passed_md):
             continue
 
         ticker = d.name.upper()
@@ -92,28 +198,23 @@ def scan_passed_records() -> list[dict]:
         }
 
         try:
-            with open(passed_md, encoding="utf-8") as f:
-                content = f.read()
+            content = _read_passed_md(passed_md)
 
             # Parse frontmatter
             if content.startswith("---"):
                 end = content.find("---", 3)
                 if end > 0:
-                    fm = content[3:end].strip()
-                    for line in fm.split("\n"):
-                        if ":" in line:
-                            k, _, v = line.partition(":")
-                            k = k.strip()
-                            v = v.strip().strip('"').strip("'")
-                            if k == "first_seen":
-                                record["passed_date"] = v
-                            elif k == "source":
-                                record["source"] = v
-                            elif k == "price_at_pass":
-                                try:
-                                    record["price_at_pass"] = float(v)
-                                except (ValueError, TypeError):
-                                    pass
+                    for k, v in _PASSED_FM_RE.findall(content[3:end]):
+                        v = v.strip().strip('"').strip("'")
+                        if k == "first_seen":
+                            record["passed_date"] = v
+                        elif k == "source":
+                            record["source"] = v
+                        elif k == "price_at_pass":
+                            try:
+                                record["price_at_pass"] = float(v)
+                            except (ValueError, TypeError):
+                                pass
 
             # Extract reason from body
             if "## Why I Passed" in content:
@@ -138,24 +239,76 @@ def scan_passed_records() -> list[dict]:
     return records
 
 
+# (ticker, ISO date) -> price, so repeated price checks on the same day are free
+_PRICE_CACHE: dict[tuple[str, str], float] = {}
+
+
 def fetch_current_prices(tickers: list[str]) -> dict[str, float]:
-    """Fetch current prices for a list of tickers via yfinance."""
+    """Fetch current prices for a list of tickers via yfinance.
+
+    All tickers go out in one batched download; fast_info.last_price is the
+    fallback for any ticker missing from the batch frame.
+    """
     prices = {}
     if not tickers:
         return prices
 
+    today = date.today().isoformat()
+    missing = []
+    for ticker in dict.fromkeys(tickers):
+        cached = _PRICE_CACHE.get((ticker, today))
+        if cached is not None:
+            prices[ticker] = cached
+        else:
+            missing.append(ticker)
+    if not missing:
+        return prices
+
     try:
         import yfinance as yf
-        for ticker in tickers:
+    except ImportError:
+        print("Warning: yfinance not installed. Price checks skipped.", file=sys.stderr)
+        return prices
+
+    # period="5d" so weekends/holidays still have a last close
+    try:
+        data = yf.download(
+            " ".join(missing),
+            period="5d",
+            interval="1d",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+            auto_adjust=False,
+        )
+    except Exception:
+        data = None
+
+    level0 = data.columns.get_level_values(0) if data is not None else ()
+    for ticker in missing:
+        price = None
+        try:
+            # Single-ticker downloads may come back without the ticker level
+            if ticker in level0:
+                df = data[ticker]
+            elif len(missing) == 1 and data is not None:
+                df = data
+            else:
+                df = None
+            if df is not None:
+                closes = df["Close"].dropna()
+                if len(closes):
+                    price = float(closes.iloc[-1])
+        except Exception:
+            price = None
+
+        if not price:
             try:
-                info = yf.Ticker(ticker).info
-                price = info.get("regularMarketPrice") or info.get("currentPrice")
-                if price:
-                    prices[ticker] = float(price)
+                price = yf.Ticker(ticker).fast_info.last_price
             except Exception:
                 continue
-    except ImportError:
-        print("Warning: yfinance not installed. Price checks skipped.", file=sys.stderr)
+        if price:
+            prices[ticker] = _PRICE_CACHE[(ticker, today)] = float(price)
 
     return prices
 
@@ -244,7 +397,10 @@ def generate_price_check_report(save: bool = False) -> str:
     for r in records:
         price_then = r["price_at_pass"]
         price_now = current_prices.get(r["ticker"])
-        reason = r["reason"][:40] + ("..." if len(r["reason"]) > 40 else "")
+        reason = r["reason"]
+        if len(reason) > 40:
+            reason = reason[:40] + "..."
+        row = f"| {r['ticker']} | {r['passed_date'] or '?'} | {reason} "
 
         if price_then and price_now:
             change_pct = (price_now - price_then) / price_then * 100
@@ -259,15 +415,13 @@ def generate_price_check_report(save: bool = False) -> str:
                 wrong_decisions += 1
 
             lines.append(
-                f"| {r['ticker']} | {r['passed_date'] or '?'} | {reason} "
-                f"| ${price_then:.2f} | ${price_now:.2f} | {change_str} | {decision} |"
+                f"{row}| ${price_then:.2f} | ${price_now:.2f} | {change_str} | {decision} |"
             )
         else:
             no_data += 1
-            lines.append(
-                f"| {r['ticker']} | {r['passed_date'] or '?'} | {reason} "
-                f"| {'$'+f'{price_then:.2f}' if price_then else '—'} | {'$'+f'{price_now:.2f}' if price_now else '—'} | — | No data |"
-            )
+            then_str = f"${price_then:.2f}" if price_then else "—"
+            now_str = f"${price_now:.2f}" if price_now else "—"
+            lines.append(f"{row}| {then_str} | {now_str} | — | No data |")
 
     # Summary
     total = correct_decisions + wrong_decisions
@@ -277,11 +431,13 @@ def generate_price_check_report(save: bool = False) -> str:
         "",
         f"- **Total passed records:** {len(records)}",
         f"- **With price data:** {total}",
-        f"- **Correct passes (stock <5% up):** {correct_decisions} ({correct_decisions/total*100:.0f}%)" if total > 0 else "",
-        f"- **Missed opportunities (stock >5% up):** {wrong_decisions} ({wrong_decisions/total*100:.0f}%)" if total > 0 else "",
     ])
 
     if total > 0:
+        lines.extend([
+            f"- **Correct passes (stock <5% up):** {correct_decisions} ({correct_decisions/total*100:.0f}%)",
+            f"- **Missed opportunities (stock >5% up):** {wrong_decisions} ({wrong_decisions/total*100:.0f}%)",
+        ])
         accuracy = correct_decisions / total * 100
         if accuracy >= 70:
             lines.append(f"\n**Assessment:** Your filtering instinct is strong ({accuracy:.0f}% accuracy). Keep trusting your pass decisions.")
@@ -312,17 +468,22 @@ def generate_full_report(save: bool = False) -> str:
     """Generate the full monthly passed review: price check + NLM discovery."""
     parts = []
 
-    # Part 1: Price check
-    parts.append(generate_price_check_report(save=False))
+    # The NLM query and the yfinance price fetch are independent network
+    # waits, so discovery runs in the background during the price check
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        discovery_future = ex.submit(discover_passed_candidates)
 
-    # Part 2: NLM discovery
-    parts.append("")
-    parts.append("---")
-    parts.append("")
-    parts.append("## NLM Discovery: Potential Passed Candidates")
-    parts.append("")
+        # Part 1: Price check
+        parts.append(generate_price_check_report(save=False))
+
+        # Part 2: NLM discovery
+        parts.append("")
+        parts.append("---")
+        parts.append("")
+        parts.append("## NLM Discovery: Potential Passed Candidates")
+        parts.append("")
 
-    discovery = discover_passed_candidates()
+        discovery = discovery_future.result()
 
     if discovery["nlm_success"]:
         if discovery["candidates"]:
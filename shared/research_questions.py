@@ -10,10 +10,13 @@ Usage:
 
 import argparse
 import json
+import os
 import re
 import sys
-from concurrent.futures import ThreadPoolExecutor
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 if sys.platform == "win32":
@@ -35,10 +38,23 @@ MAX_THESIS_CHARS = 2000
 FALLBACK_CHARS = 8000
 LOCAL_CONTEXT_WINDOW = 20  # lines above/below each question
 MAX_PRIOR_ANSWERS_CHARS = 6000  # cap prior answers in followup context
+INLINE_WORKERS = 5  # concurrent requests in legacy inline mode (OpenAI rate limits)
 
 
 # ── Parse ────────────────────────────────────────────────────
 
+# `- [?] question` (matched against the stripped line)
+_Q_LINE_RE = re.compile(r"^- \[\?\]\s+(.+)$")
+
+# Informal question markers, tried in order; group 1 is the question
+_INFORMAL_Q_RES = (
+    re.compile(r"^- [?？]\s*(.+)$"),  # `- ?question` or `- ？question`
+    re.compile(r"^- \[ \]\s*[?？]\s*(.+)$"),  # `- [ ] ？question` (checkbox)
+    re.compile(r"^\*\s+[?？]\s*(.+)$"),  # `* ？question` (asterisk bullet)
+    re.compile(r"^[?？]\s*(.+)$"),  # `？question` at line start (no bullet)
+    re.compile(r"^\d+[.)]\s*[?？]\s*(.+)$"),  # `N. ？question` (numbered)
+)
+
 
 def find_latest_analysis(ticker: str, file_path: str = None) -> Path | None:
     """Find the latest analysis file for a ticker. Returns None if not found."""
@@ -49,29 +65,37 @@ def find_latest_analysis(ticker: str, file_path: str = None) -> Path | None:
         print(f"Error: Specified file not found: {file_path}", file=sys.stderr)
         return None
 
-    folder = EARNINGS_FOLDER / ticker.upper()
-    if not folder.exists():
-        # Try with common suffixes: FND -> FND-US, BABA -> BABA-HK, etc.
-        for suffix in ("-US", "-CA", "-HK", "-UK", "-EU"):
-            candidate = EARNINGS_FOLDER / f"{ticker.upper()}{suffix}"
-            if candidate.exists():
-                folder = candidate
-                break
-        else:
-            print(f"Error: No analysis folder for {ticker}: {folder}", file=sys.stderr)
-            return None
-
-    # Find analysis files (skip _ prefixed notes files)
-    analyses = sorted(
-        [f for f in folder.glob("*.md") if not f.name.startswith("_")],
-        key=lambda f: f.stat().st_mtime,
-        reverse=True,
-    )
-    if not analyses:
+    # Try the bare ticker first, then common suffixes: FND -> FND-US, BABA -> BABA-HK, etc.
+    base = ticker.upper()
+    for name in (base, *(f"{base}{suffix}" for suffix in ("-US", "-CA", "-HK", "-UK", "-EU"))):
+        folder = EARNINGS_FOLDER / name
+        try:
+            with os.scandir(folder) as it:
+                # Newest analysis file (skip _ prefixed notes files); DirEntry
+                # caches the type and, on Windows, the stat from the listing
+                latest = max(
+                    (
+                        e for e in it
+                        if os.path.normcase(e.name).endswith(".md")
+                        and not e.name.startswith("_")
+                        and e.is_file()
+                    ),
+                    key=lambda e: e.stat().st_mtime,
+                    default=None,
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        break
+    else:
+        folder = EARNINGS_FOLDER / base
+        print(f"Error: No analysis folder for {ticker}: {folder}", file=sys.stderr)
+        return None
+
+    if latest is None:
         print(f"Error: No analysis files found in {folder}", file=sys.stderr)
         return None
 
-    return analyses[0]
+    return Path(latest.path)
 
 
 def _normalize_question_markers(filepath: Path) -> int:
@@ -92,35 +116,11 @@ def _normalize_question_markers(filepath: Path) -> int:
             continue
 
         new_line = None
-
-        # Pattern: `- ?question` or `- ？question`
-        m = re.match(r"^- [?？]\s*(.+)$", stripped)
-        if m:
-            new_line = f"- [?] {m.group(1).strip()}"
-
-        # Pattern: `- [ ] ？question` or `- [ ] ?question` (checkbox)
-        if not new_line:
-            m = re.match(r"^- \[ \]\s*[?？]\s*(.+)$", stripped)
-            if m:
-                new_line = f"- [?] {m.group(1).strip()}"
-
-        # Pattern: `* ？question` or `* ?question` (asterisk bullet)
-        if not new_line:
-            m = re.match(r"^\*\s+[?？]\s*(.+)$", stripped)
-            if m:
-                new_line = f"- [?] {m.group(1).strip()}"
-
-        # Pattern: `？question` at line start (no bullet)
-        if not new_line:
-            m = re.match(r"^[?？]\s*(.+)$", stripped)
-            if m:
-                new_line = f"- [?] {m.group(1).strip()}"
-
-        # Pattern: `N. ？question` or `N. ?question` (numbered)
-        if not new_line:
-            m = re.match(r"^\d+[.)]\s*[?？]\s*(.+)$", stripped)
+        for pattern in _INFORMAL_Q_RES:
+            m = pattern.match(stripped)
             if m:
                 new_line = f"- [?] {m.group(1).strip()}"
+                break
 
         if new_line:
             # Preserve leading whitespace
@@ -173,7 +173,7 @@ def parse_research_questions(filepath: Path) -> list[dict]:
             continue
 
         # Match - [?] question pattern anywhere in the file
-        m = re.match(r"^- \[\?\]\s+(.+)$", stripped)
+        m = _Q_LINE_RE.match(stripped)
         if m:
             local_ctx = _extract_local_context(lines, i)
             questions.append(
@@ -191,35 +191,71 @@ def parse_research_questions(filepath: Path) -> list[dict]:
 # ── Context Assembly ─────────────────────────────────────────
 
 
-def _extract_section(text: str, header_pattern: str, max_chars: int) -> str:
+# Lines whose first non-blank character is '#'; group 1 is the rest of the line
+_HASH_LINE_RE = re.compile(r"^[^\S\n]*(#[^\n]*)", re.MULTILINE)
+_HEADING_RE = re.compile(r"(#{1,6})\s")
+
+_SECTION1_RE = re.compile(r"^#{1,5}\s*1\.\s*综合评估")
+_SECTION2_RE = re.compile(r"^#{1,5}\s*2\.\s*业绩概览")
+_AI_ANALYSIS_RE = re.compile(r"^##\s*AI Analysis")
+_CORE_THESIS_RE = re.compile(r"^##\s*Core Thesis")
+_BULL_CASE_RE = re.compile(r"^##\s*Bull Case")
+_BEAR_CASE_RE = re.compile(r"^##\s*Bear Case")
+
+
+@lru_cache(maxsize=4)
+def _hash_lines(text: str) -> list[tuple[int, int, str]]:
+    """(line start, line end, stripped line) for every '#' line, found in one scan.
+
+    Cached on the text so repeated section lookups in one document reuse it.
+    """
+    return [(m.start(), m.end(), m.group(1).rstrip()) for m in _HASH_LINE_RE.finditer(text)]
+
+
+def _extract_section(text: str, header_re: re.Pattern, max_chars: int) -> str:
     """Extract content under a markdown header matching the pattern.
-    Stops at next heading of equal or higher level (fewer or equal #'s)."""
-    lines = text.split("\n")
-    collecting = False
-    collected = []
+    Stops at next heading of equal or higher level (fewer or equal #'s).
+    header_re is matched against stripped lines that start with '#'."""
+    heads = _hash_lines(text)
+    for k, (_, end, stripped) in enumerate(heads):
+        if header_re.match(stripped):
+            break
+    else:
+        return ""
+    if end == len(text):
+        return ""
+
+    # Determine heading level (count leading #'s)
+    section_level = len(stripped) - len(stripped.lstrip("#"))
+    body = end + 1
+
+    # Stop at same-level or higher heading (not sub-headings); the first
+    # body line is always kept
+    stop = len(text)
+    for start, _, line in heads[k + 1:]:
+        if start == body:
+            continue
+        m = _HEADING_RE.match(line)
+        if m and len(m.group(1)) <= section_level:
+            stop = start - 1
+            break
+
+    # Keep whole lines until their combined length reaches max_chars
+    pos = body
     chars = 0
-    section_level = 0  # track heading level of matched section
+    while True:
+        nl = text.find("\n", pos, stop)
+        line_end = stop if nl == -1 else nl
+        chars += line_end - pos
+        if nl == -1 or chars >= max_chars:
+            break
+        pos = nl + 1
+
+    return text[body:line_end].strip()
 
-    for line in lines:
-        stripped = line.strip()
-        if not collecting and re.match(header_pattern, stripped):
-            # Determine heading level (count leading #'s)
-            section_level = len(stripped) - len(stripped.lstrip("#"))
-            collecting = True
-            continue
-        if collecting:
-            # Stop at same-level or higher heading (not sub-headings)
-            heading_match = re.match(r"^(#{1,6})\s", stripped)
-            if heading_match and collected:
-                this_level = len(heading_match.group(1))
-                if this_level <= section_level:
-                    break
-            collected.append(line)
-            chars += len(line)
-            if chars >= max_chars:
-                break
 
-    return "\n".join(collected).strip()
+# `key: value` frontmatter line, split at the first colon
+_FM_KV_RE = re.compile(r"^([^:\n]*):([^\n]*)", re.MULTILINE)
 
 
 def _extract_frontmatter(text: str) -> dict:
@@ -230,11 +266,8 @@ def _extract_frontmatter(text: str) -> dict:
     end = text.find("---", 3)
     if end == -1:
         return fm
-    block = text[3:end]
-    for line in block.split("\n"):
-        if ":" in line:
-            key, _, val = line.partition(":")
-            fm[key.strip()] = val.strip()
+    for key, val in _FM_KV_RE.findall(text[3:end]):
+        fm[key.strip()] = val.strip()
     return fm
 
 
@@ -250,27 +283,28 @@ def assemble_context(ticker: str, analysis_path: Path) -> dict:
     quarters = fm.get("quarters", "")
 
     # Section 1: 综合评估 (~6k chars)
-    section1 = _extract_section(
-        text, r"^#{1,5}\s*1\.\s*综合评估", MAX_CONTEXT_CHARS
-    )
+    section1 = _extract_section(text, _SECTION1_RE, MAX_CONTEXT_CHARS)
 
     # Section 2: 业绩概览 (~2k chars)
-    section2 = _extract_section(text, r"^#{1,5}\s*2\.\s*业绩概览", 2000)
+    section2 = _extract_section(text, _SECTION2_RE, 2000)
 
     # Fallback: if Section 1 not found, use first 8k chars of AI Analysis
     if not section1:
-        ai_section = _extract_section(text, r"^##\s*AI Analysis", FALLBACK_CHARS)
+        ai_section = _extract_section(text, _AI_ANALYSIS_RE, FALLBACK_CHARS)
         section1 = ai_section[:FALLBACK_CHARS] if ai_section else text[:FALLBACK_CHARS]
 
     # Thesis summary
     thesis_summary = ""
     thesis_path = PORTFOLIO_DIR / ticker.upper() / "thesis.md"
-    if thesis_path.exists():
+    try:
         thesis_text = thesis_path.read_text(encoding="utf-8")
+    except (FileNotFoundError, NotADirectoryError):
+        thesis_text = None
+    if thesis_text is not None:
         # Extract Bull Case + Bear Case + Core Thesis
-        core = _extract_section(thesis_text, r"^##\s*Core Thesis", 500)
-        bull = _extract_section(thesis_text, r"^##\s*Bull Case", 800)
-        bear = _extract_section(thesis_text, r"^##\s*Bear Case", 800)
+        core = _extract_section(thesis_text, _CORE_THESIS_RE, 500)
+        bull = _extract_section(thesis_text, _BULL_CASE_RE, 800)
+        bear = _extract_section(thesis_text, _BEAR_CASE_RE, 800)
         parts = []
         if core:
             parts.append(f"**Core Thesis:** {core}")
@@ -289,23 +323,29 @@ def assemble_context(ticker: str, analysis_path: Path) -> dict:
     }
 
 
+_ANSWER_HEADER = "## Research Questions — AI Answers"
+_ANSWER_HEADER_RE = re.compile(r"^[^\S\n]*" + re.escape(_ANSWER_HEADER) + r"[^\n]*", re.MULTILINE)
+_RULE_LINE_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+
+
 def _extract_answer_section(filepath: Path) -> str:
     """Extract existing 'Research Questions — AI Answers' section content (between header and ---)."""
     text = filepath.read_text(encoding="utf-8")
-    lines = text.split("\n")
-
-    collecting = False
-    collected = []
-    for line in lines:
-        if line.strip().startswith("## Research Questions — AI Answers"):
-            collecting = True
-            continue
-        if collecting:
-            if line.strip() == "---":
-                break
-            collected.append(line)
 
-    return "\n".join(collected).strip()
+    # Locate the header and the closing rule, then slice; no per-line list
+    header = _ANSWER_HEADER_RE.search(text)
+    if not header or header.end() == len(text):
+        return ""
+    start = header.end() + 1
+    rule = _RULE_LINE_RE.search(text, start)
+    body = text[start:rule.start() - 1] if rule else text[start:]
+
+    # Repeated header lines inside the section are not part of its content
+    if _ANSWER_HEADER in body:
+        body = "\n".join(
+            line for line in body.split("\n") if not line.strip().startswith(_ANSWER_HEADER)
+        )
+    return body.strip()
 
 
 # ── Prompt ───────────────────────────────────────────────────
@@ -678,7 +718,7 @@ def write_answers_to_top(filepath: Path, questions: list[dict],
         stripped = line.strip()
         if "提问语法" in stripped:
             continue
-        if re.match(r"^- \[\?\]\s+", stripped):
+        if _Q_LINE_RE.match(stripped):
             for q in questions:
                 if q["question"] in line:
                     final_lines[i] = line.replace("- [?]", "- [x]", 1)
@@ -689,46 +729,89 @@ def write_answers_to_top(filepath: Path, questions: list[dict],
     print(f"  ✓ Marked {len(questions)} question(s) as [x]")
 
 
+def _atomic_write_text(filepath: Path, text: str) -> None:
+    """Write text via a temp file + os.replace so the note is never half-written."""
+    fd, tmp = tempfile.mkstemp(dir=filepath.parent, suffix=".md.tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        try:
+            os.chmod(tmp, filepath.stat().st_mode & 0o7777)
+        except OSError:
+            pass
+        os.replace(tmp, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def write_answers_to_file(filepath: Path, qa_pairs: list[dict]) -> None:
     """
     Write answers back inline (legacy mode).
     For each pair: [?] → [x], insert blockquote answer below.
+    The file is read once, edited in memory and replaced atomically.
     """
-    for pair in qa_pairs:
-        text = filepath.read_text(encoding="utf-8")
-        lines = text.split("\n")
+    lines = filepath.read_text(encoding="utf-8").split("\n")
 
+    # Index open [?] lines by question text once instead of rescanning per pair
+    q_lines = []
+    idx_by_q: dict[str, list[int]] = {}
+    for i, line in enumerate(lines):
+        m = _Q_LINE_RE.match(line.strip())
+        if m:
+            q_lines.append(i)
+            idx_by_q.setdefault(m.group(1).strip(), []).append(i)
+
+    claimed = set()
+    edits = []
+    written = []
+    for pair in qa_pairs:
         question_text = pair["question"]
         answer = pair["answer"]
         model = pair.get("model", "GPT-5.2")
         now_str = datetime.now().strftime("%Y-%m-%d %H:%M")
 
-        target_idx = None
-        for i, line in enumerate(lines):
-            if re.match(r"^- \[\?\]\s+", line.strip()) and question_text in line:
-                target_idx = i
-                break
+        target_idx = next(
+            (i for i in idx_by_q.get(question_text, ()) if i not in claimed), None
+        )
+        if target_idx is None:
+            # Line edited since parsing: fall back to a substring match
+            target_idx = next(
+                (i for i in q_lines if i not in claimed and question_text in lines[i]),
+                None,
+            )
 
         if target_idx is None:
             print(f"  Warning: Could not find [?] line for: {question_text[:50]}...")
             continue
-
-        lines[target_idx] = lines[target_idx].replace("- [?]", "- [x]", 1)
+        claimed.add(target_idx)
 
         answer_lines = answer.strip().split("\n")
         formatted = [f"  > **{model} | {now_str}**", "  >"]
         for aline in answer_lines:
             formatted.append(f"  > {aline}")
         formatted.append("")
+        edits.append((target_idx, formatted))
+        written.append(question_text)
+
+    if not written:
+        return
+
+    # Apply bottom-up so earlier line numbers stay valid after insertions
+    for target_idx, formatted in sorted(edits, key=lambda e: e[0], reverse=True):
+        lines[target_idx] = lines[target_idx].replace("- [?]", "- [x]", 1)
 
         insert_pos = target_idx + 1
         while insert_pos < len(lines) and lines[insert_pos].strip().startswith(">"):
             insert_pos += 1
 
-        for j, fline in enumerate(formatted):
-            lines.insert(insert_pos + j, fline)
+        lines[insert_pos:insert_pos] = formatted
 
-        filepath.write_text("\n".join(lines), encoding="utf-8")
+    _atomic_write_text(filepath, "\n".join(lines))
+    for question_text in written:
         print(f"  ✓ Wrote answer for: {question_text[:60]}...")
 
 
@@ -784,7 +867,7 @@ def write_followup_answers(filepath: Path, questions: list[dict],
         stripped = line.strip()
         if "提问语法" in stripped:
             continue
-        if re.match(r"^- \[\?\]\s+", stripped):
+        if _Q_LINE_RE.match(stripped):
             for q in questions:
                 if q["question"] in line:
                     final_lines[i] = line.replace("- [?]", "- [x]", 1)
@@ -1039,32 +1122,49 @@ def run(ticker: str, dry_run: bool = False, file_path: str = None,
 
 
 def _run_inline(ticker, questions, context, analysis_path, model):
-    """Legacy inline mode: send each question individually, write answer below."""
-    openai_key, _ = _load_api_keys()
-    model_display = model or "GPT-5.2"
+    """Legacy inline mode: send each question individually, write answer below.
 
-    qa_pairs = []
-    for i, q in enumerate(questions, 1):
-        print(f"\n── Sending question {i}/{len(questions)} to {model_display} ──")
-        print(f"  Q: {q['question'][:80]}")
+    Questions are independent, so they go out INLINE_WORKERS at a time;
+    failures are retried once as a second concurrent round.
+    """
+    model_display = model or "GPT-5.2"
+    total = len(questions)
+    print(f"\n── Sending {total} question(s) to {model_display} "
+          f"({min(INLINE_WORKERS, total)} at a time) ──")
+
+    answers: list[str | None] = [None] * total
+    pending = list(range(total))
+    for attempt in range(2):
+        failed = []
+        with ThreadPoolExecutor(max_workers=min(INLINE_WORKERS, len(pending))) as ex:
+            futures = {
+                ex.submit(send_to_chatgpt, questions[i]["question"], context, model=model): i
+                for i in pending
+            }
+            for fut in as_completed(futures):
+                i = futures[fut]
+                q_short = questions[i]["question"][:60]
+                try:
+                    answers[i] = fut.result()
+                except Exception as e:
+                    failed.append(i)
+                    if attempt == 0:
+                        print(f"  ⚠ [{i + 1}/{total}] Error: {e}. Retrying... ({q_short})")
+                    else:
+                        print(f"  ✗ [{i + 1}/{total}] Failed after retry: {e} ({q_short})")
+                    continue
+                retry_note = " on retry" if attempt else ""
+                print(f"  ✓ [{i + 1}/{total}] Got answer{retry_note} "
+                      f"({len(answers[i])} chars): {q_short}")
+        if not failed:
+            break
+        pending = sorted(failed)
 
-        try:
-            answer = send_to_chatgpt(q["question"], context, model=model)
-            qa_pairs.append(
-                {"question": q["question"], "answer": answer, "model": model_display}
-            )
-            print(f"  ✓ Got answer ({len(answer)} chars)")
-        except Exception as e:
-            print(f"  ⚠ Error: {e}. Retrying...")
-            try:
-                answer = send_to_chatgpt(q["question"], context, model=model)
-                qa_pairs.append(
-                    {"question": q["question"], "answer": answer, "model": model_display}
-                )
-                print(f"  ✓ Got answer on retry ({len(answer)} chars)")
-            except Exception as e2:
-                print(f"  ✗ Failed after retry: {e2}")
-                continue
+    qa_pairs = [
+        {"question": q["question"], "answer": answer, "model": model_display}
+        for q, answer in zip(questions, answers)
+        if answer is not None
+    ]
 
     if not qa_pairs:
         print("\n✗ No answers received.")
@@ -5,8 +5,12 @@ Each skill has a `lessons.md` file; lessons are markdown entries with timestamps
 Distillation promotes recurring patterns to `context/memory/tools.md`.
 """
 
+import io
+import os
 import re
-from datetime import datetime, timedelta
+import threading
+from collections import Counter
+from datetime import date, timedelta
 from pathlib import Path
 
 SKILLS_DIR = Path(__file__).resolve().parent.parent  # .claude/skills/
@@ -14,7 +18,15 @@ MEMORY_TARGET = SKILLS_DIR.parent / "context" / "memory" / "tools.md"
 
 MAX_ENTRIES = 50
 MAX_AGE_DAYS = 90
-ENTRY_RE = re.compile(r"^## (\d{4}-\d{2}-\d{2}) \| (.+)$")
+ENTRY_PATTERN = r"^## (\d{4}-\d{2}-\d{2}) \| (.+)$"
+_entry_re: re.Pattern | None = None  # compiled on first parse
+
+LIST_WORKERS = 8
+
+PARSE_CACHE_MAX = 64
+# path -> (st_mtime_ns, st_size, entries, canonical)
+_parse_cache: dict[Path, tuple[int, int, list[dict], bool]] = {}
+_parse_cache_lock = threading.Lock()
 
 
 def _lessons_path(skill_name: str) -> Path:
@@ -22,47 +34,148 @@ def _lessons_path(skill_name: str) -> Path:
     return SKILLS_DIR / skill_name / "lessons.md"
 
 
+def _entry_regex() -> re.Pattern:
+    """Return the compiled entry-header regex, compiling it on first use."""
+    global _entry_re
+    if _entry_re is None:
+        _entry_re = re.compile(ENTRY_PATTERN, re.MULTILINE)
+    return _entry_re
+
+
 def _parse_entries(text: str) -> list[dict]:
     """Parse lessons.md content into a list of entry dicts."""
     entries = []
-    lines = text.split("\n")
-    current = None
-    for line in lines:
-        m = ENTRY_RE.match(line)
-        if m:
-            if current:
-                entries.append(current)
-            current = {
-                "date": m.group(1),
-                "summary": m.group(2),
-                "body_lines": [],
-            }
-        elif current is not None:
-            current["body_lines"].append(line)
-    if current:
-        entries.append(current)
-    # Strip trailing blank lines from each body
-    for e in entries:
-        while e["body_lines"] and not e["body_lines"][-1].strip():
-            e["body_lines"].pop()
+    matches = list(_entry_regex().finditer(text))
+    for i, m in enumerate(matches):
+        end = matches[i + 1].start() - 1 if i + 1 < len(matches) else len(text)
+        body = text[m.end() + 1 : end]
+        # Strip trailing blank lines from the body
+        tail = body.rstrip()
+        if not tail:
+            body = ""
+        else:
+            cut = body.find("\n", len(tail))
+            if cut >= 0:
+                body = body[:cut]
+        entries.append({"date": m.group(1), "summary": m.group(2), "body": body})
     return entries
 
 
+def _parse_tail(text: str, n: int) -> list[dict]:
+    """Parse only as much of the end of `text` as holds its last n entries."""
+    entry_re = _entry_regex()
+    pos = len(text)
+    found = 0
+    while found < n:
+        pos = text.rfind("\n## ", 0, pos)
+        if pos < 0:
+            return _parse_entries(text)
+        if entry_re.match(text, pos + 1):
+            found += 1
+    return _parse_entries(text[pos + 1 :])
+
+
+def _render_entry(e: dict) -> str:
+    """Render one entry as the blank-line-prefixed block _render_entries emits."""
+    if e["body"]:
+        return f"\n## {e['date']} | {e['summary']}\n{e['body']}\n"
+    return f"\n## {e['date']} | {e['summary']}\n"
+
+
 def _render_entries(entries: list[dict]) -> str:
     """Render entry dicts back to markdown."""
-    parts = ["# Lessons Learned\n"]
+    buf = io.StringIO()
+    buf.write("# Lessons Learned\n")
     for e in entries:
-        parts.append(f"## {e['date']} | {e['summary']}")
-        if e["body_lines"]:
-            parts.append("\n".join(e["body_lines"]))
-        parts.append("")  # blank line separator
-    return "\n".join(parts)
+        buf.write(_render_entry(e))
+    return buf.getvalue()
+
+
+def _cache_entries(
+    path: Path, entries: list[dict], canonical: bool, st: os.stat_result | None = None
+) -> None:
+    """Remember parsed entries for the file's stat signature."""
+    if st is None:
+        st = path.stat()
+    with _parse_cache_lock:
+        if path not in _parse_cache and len(_parse_cache) >= PARSE_CACHE_MAX:
+            del _parse_cache[next(iter(_parse_cache))]
+        _parse_cache[path] = (st.st_mtime_ns, st.st_size, entries, canonical)
+
+
+def _cached_entries(path: Path, st: os.stat_result) -> tuple[list[dict], bool] | None:
+    """Return cached (entries, canonical) if still valid for `st`."""
+    cached = _parse_cache.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2], cached[3]
+    return None
+
+
+def _read_entries(path: Path, require: str | None = None) -> tuple[list[dict], bool]:
+    """Read and parse a lessons.md, reusing the cached parse if unchanged.
+
+    Returns (entries, canonical); canonical means the file on disk is exactly
+    what writing _render_entries(entries) would produce, so new entries can be
+    appended without rewriting it. If `require` is given and a freshly read
+    file does not contain it, ([], False) is returned without parsing.
+    """
+    st = path.stat()
+    cached = _cached_entries(path, st)
+    if cached:
+        return cached
+    with open(path, encoding="utf-8", newline="") as f:
+        raw = f.read()
+    if require is not None and require not in raw:
+        return [], False
+    # Same newline translation read_text() applies
+    text = raw.replace("\r\n", "\n").replace("\r", "\n") if "\r" in raw else raw
+    entries = _parse_entries(text)
+    rendered = _render_entries(entries)
+    if os.linesep != "\n":
+        rendered = rendered.replace("\n", os.linesep)
+    canonical = raw == rendered
+    _cache_entries(path, entries, canonical, st)
+    return entries, canonical
+
+
+def _load_entries(path: Path, require: str | None = None) -> list[dict]:
+    """Return a fresh list of a lessons.md's entries (see _read_entries).
+
+    Entry dicts are shared with the cache and must not be mutated.
+    """
+    return list(_read_entries(path, require)[0])
+
+
+def _write_entries(path: Path, entries: list[dict]) -> None:
+    """Render entries to disk and refresh the parse cache from the output."""
+    text = _render_entries(entries)
+    path.write_text(text, encoding="utf-8")
+    parsed = _parse_entries(text)
+    _cache_entries(path, parsed, "\r" not in text and text == _render_entries(parsed))
+
 
+def _append_entry(path: Path, entries: list[dict], entry: dict) -> bool:
+    """Append one entry to a canonical lessons.md holding `entries`.
 
-def _trim_entries(entries: list[dict]) -> list[dict]:
+    Returns False without touching the file if the entry would not parse
+    back as itself (e.g. a body line that looks like a header).
+    """
+    chunk = _render_entry(entry)
+    if "\r" in chunk or _parse_entries(chunk) != [entry]:
+        return False
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(chunk)
+    _cache_entries(path, [*entries, entry], True)
+    return True
+
+
+def _trim_entries(entries: list[dict], today: date | None = None) -> list[dict]:
     """Enforce rolling window: max MAX_ENTRIES, drop older than MAX_AGE_DAYS."""
-    cutoff = (datetime.now() - timedelta(days=MAX_AGE_DAYS)).strftime("%Y-%m-%d")
-    entries = [e for e in entries if e["date"] >= cutoff]
+    cutoff = ((today or date.today()) - timedelta(days=MAX_AGE_DAYS)).isoformat()
+    # Hand-edited files are not always in date order, so scan every entry;
+    # only rebuild the list when something is actually stale.
+    if any(e["date"] < cutoff for e in entries):
+        entries = [e for e in entries if e["date"] >= cutoff]
     if len(entries) > MAX_ENTRIES:
         entries = entries[-MAX_ENTRIES:]
     return entries
@@ -71,10 +184,18 @@ def _trim_entries(entries: list[dict]) -> list[dict]:
 def read_lessons(skill_name: str, max_entries: int = 5) -> str:
     """Return the most recent N lesson entries as markdown."""
     path = _lessons_path(skill_name)
-    if not path.exists():
+    try:
+        st = path.stat()
+        cached = _cached_entries(path, st)
+        if cached:
+            entries = cached[0]
+        elif max_entries > 0:
+            # Only the newest entries are shown, so skip parsing the rest
+            entries = _parse_tail(path.read_text(encoding="utf-8"), max_entries)
+        else:
+            entries = _load_entries(path)
+    except (FileNotFoundError, NotADirectoryError):
         return f"No lessons.md found for skill '{skill_name}'."
-    text = path.read_text(encoding="utf-8")
-    entries = _parse_entries(text)
     if not entries:
         return f"No lessons recorded for '{skill_name}'."
     recent = entries[-max_entries:]
@@ -89,26 +210,29 @@ def write_lesson(skill_name: str, lesson_text: str) -> str:
         Remaining lines = body (optional details)
     """
     path = _lessons_path(skill_name)
-    if not path.exists():
+    try:
+        entries, canonical = _read_entries(path)
+    except (FileNotFoundError, NotADirectoryError):
         return f"Error: no lessons.md for skill '{skill_name}'. Create it first."
 
-    text = path.read_text(encoding="utf-8")
-    entries = _parse_entries(text)
-
-    lines = lesson_text.strip().split("\n")
+    lines = lesson_text.strip().splitlines() or [""]
     summary = lines[0].strip()
-    body_lines = lines[1:] if len(lines) > 1 else []
+    body = "\n".join(lines[1:])
 
+    today = date.today()
     entry = {
-        "date": datetime.now().strftime("%Y-%m-%d"),
+        "date": today.isoformat(),
         "summary": summary,
-        "body_lines": body_lines,
+        "body": body,
     }
-    entries.append(entry)
-    entries = _trim_entries(entries)
+    updated = [*entries, entry]
+    trimmed = _trim_entries(updated, today)
 
-    path.write_text(_render_entries(entries), encoding="utf-8")
-    return f"Lesson recorded for '{skill_name}' ({len(entries)} total)."
+    # _trim_entries hands back its input when nothing is dropped; then the
+    # file only grows and the new entry can be appended in place.
+    if not (canonical and trimmed is updated and _append_entry(path, entries, entry)):
+        _write_entries(path, trimmed)
+    return f"Lesson recorded for '{skill_name}' ({len(trimmed)} total)."
 
 
 def distill_lessons(skill_name: str, dry_run: bool = False) -> dict:
@@ -118,19 +242,20 @@ def distill_lessons(skill_name: str, dry_run: bool = False) -> dict:
     Returns dict with 'patterns' found and 'distilled' count.
     """
     path = _lessons_path(skill_name)
-    if not path.exists():
+    try:
+        # A file with no "Problem:" text at all is not worth parsing
+        entries = _load_entries(path, require="Problem:")
+    except (FileNotFoundError, NotADirectoryError):
         return {"error": f"No lessons.md for '{skill_name}'"}
 
-    text = path.read_text(encoding="utf-8")
-    entries = _parse_entries(text)
-
     # Count "Problem:" lines
-    problem_counts: dict[str, int] = {}
-    for e in entries:
-        for line in e["body_lines"]:
-            line_s = line.strip()
-            if line_s.startswith("Problem:"):
-                problem_counts[line_s] = problem_counts.get(line_s, 0) + 1
+    problem_counts = Counter(
+        line_s
+        for e in entries
+        if "Problem:" in e["body"]
+        for line in e["body"].split("\n")
+        if (line_s := line.strip()).startswith("Problem:")
+    )
 
     # Filter to 3+ occurrences
     recurring = {k: v for k, v in problem_counts.items() if v >= 3}
@@ -150,27 +275,35 @@ def distill_lessons(skill_name: str, dry_run: bool = False) -> dict:
         }
 
     # Build distill summary
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = date.today().isoformat()
     distill_lines = [f"\n## Skill Lessons Distilled: {skill_name} ({today})"]
     for problem, count in recurring.items():
         distill_lines.append(f"- ({count}x) {problem}")
 
-    # Append to memory target
-    MEMORY_TARGET.parent.mkdir(parents=True, exist_ok=True)
-    with open(MEMORY_TARGET, "a", encoding="utf-8") as f:
-        f.write("\n".join(distill_lines) + "\n")
+    # Append to memory target, creating its directory only when missing
+    distill_text = "\n".join(distill_lines) + "\n"
+    try:
+        f = open(MEMORY_TARGET, "a", encoding="utf-8")
+    except FileNotFoundError:
+        MEMORY_TARGET.parent.mkdir(parents=True, exist_ok=True)
+        f = open(MEMORY_TARGET, "a", encoding="utf-8")
+    with f:
+        f.write(distill_text)
 
     # Replace distilled entries with a summary marker in lessons.md
-    for e in entries:
+    recurring_set = frozenset(recurring)
+    for i, e in enumerate(entries):
+        if "Problem:" not in e["body"]:
+            continue
         new_body = []
-        for line in e["body_lines"]:
-            if line.strip() in recurring:
-                new_body.append(f"[Distilled → memory/tools.md] {line.strip()}")
+        for line in e["body"].split("\n"):
+            if "Problem:" in line and (line_s := line.strip()) in recurring_set:
+                new_body.append(f"[Distilled → memory/tools.md] {line_s}")
             else:
                 new_body.append(line)
-        e["body_lines"] = new_body
+        entries[i] = {**e, "body": "\n".join(new_body)}
 
-    path.write_text(_render_entries(entries), encoding="utf-8")
+    _write_entries(path, entries)
 
     return {
         "patterns": recurring,
@@ -179,23 +312,33 @@ def distill_lessons(skill_name: str, dry_run: bool = False) -> dict:
     }
 
 
+def _read_skill_lessons(name: str) -> list[dict] | None:
+    """Return a skill's lesson entries, or None if it has no lessons.md."""
+    try:
+        return _load_entries(SKILLS_DIR / name / "lessons.md")
+    except FileNotFoundError:
+        return None
+
+
 def list_all_lessons(max_per_skill: int = 3) -> str:
     """Cross-skill overview of recent lessons."""
+    from concurrent.futures import ThreadPoolExecutor
+
     output = ["# Skill Lessons Overview\n"]
-    skill_dirs = sorted(
-        d
-        for d in SKILLS_DIR.iterdir()
-        if d.is_dir() and d.name != "shared" and (d / "lessons.md").exists()
-    )
+    with os.scandir(SKILLS_DIR) as it:
+        skill_dirs = sorted(
+            (e.name for e in it if e.name != "shared" and e.is_dir()),
+            key=os.path.normcase,
+        )
+    with ThreadPoolExecutor(max_workers=LIST_WORKERS) as pool:
+        results = list(pool.map(_read_skill_lessons, skill_dirs))
     found = 0
-    for d in skill_dirs:
-        text = (d / "lessons.md").read_text(encoding="utf-8")
-        entries = _parse_entries(text)
+    for name, entries in zip(skill_dirs, results):
         if not entries:
             continue
         found += 1
         recent = entries[-max_per_skill:]
-        output.append(f"## {d.name}")
+        output.append(f"## {name}")
         for e in recent:
             output.append(f"- **{e['date']}** — {e['summary']}")
         output.append("")